@@ -1,6 +1,7 @@
 # base/base_entity.py
 from abc import ABC, abstractmethod
 from utils.logging_setup import logger
+from operator import attrgetter
 
 """ Base entity class to be used for base-class objects:
     1) Obesrvation (observation.py)
@@ -10,7 +11,12 @@ from utils.logging_setup import logger
     5) Telescope, SpaceTelescope, Telescopes (telescopes.py)
     """
 
+# activation flag reader shared by the containers for filtering and counting entities
+_get_isactive = attrgetter("isactive")
+
 class BaseEntity(ABC):
+    __slots__ = ("isactive",)
+
     def __init__(self, isactive: bool = True):
         """Init the entity"""
         self.isactive = isactive
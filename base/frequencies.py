@@ -3,6 +3,7 @@ from base.base_entity import BaseEntity
 from utils.validation import check_type, check_non_negative, check_positive, check_list_type, check_non_zero
 from utils.logging_setup import logger
 from typing import Optional, Union, List
+import numpy as np
 
 # Speed of light constant in MHz * cm
 C_MHZ_CM = 29979.2458
@@ -46,6 +47,8 @@ VALID_POLARIZATIONS = CIRCULAR_POLARIZATIONS.union(PAIRED_LINEAR_POLARIZATIONS).
         __repr__
     """
 class IF(BaseEntity):
+    __slots__ = ("_frequency", "_bandwidth", "_wavelength", "_polarizations")
+
     def __init__(self, freq: float = 1000.0, bandwidth: float = 16.0, 
                  polarization: Optional[str] = None, isactive: bool = True):
         """Initialize an IF object with frequency, bandwidth, and polarization
@@ -61,8 +64,9 @@ class IF(BaseEntity):
         check_positive(bandwidth, "Bandwidth")
         self._frequency = freq
         self._bandwidth = bandwidth
+        self._wavelength = None  # cached wavelength in cm, reset when the frequency changes
         self._polarizations = self._validate_polarizations(polarization)
-        logger.info(f"Initialized IF with frequency={freq} MHz, bandwidth={bandwidth} MHz, polarizations={self._polarizations}")
+        logger.info("Initialized IF with frequency=%s MHz, bandwidth=%s MHz, polarizations=%s", freq, bandwidth, self._polarizations)
 
     def activate(self) -> None:
         """Activate IF frequency"""
@@ -74,26 +78,25 @@ class IF(BaseEntity):
 
     def get_frequency(self) -> float:
         """Return the IF frequency value in MHz"""
-        logger.debug(f"Retrieved IF frequency={self._frequency} MHz for IF")
         return self._frequency
 
     def get_bandwidth(self) -> float:
         """Return the IF bandwidth value in MHz"""
-        logger.debug(f"Retrieved IF bandwidth={self._bandwidth} MHz for IF")
         return self._bandwidth
 
     def get_polarization(self) -> List[str]:
         """Return the IF polarization values as a list"""
-        logger.debug(f"Retrieved IF polarizations={self._polarizations} for IF")
         return self._polarizations
 
     def get_frequency_wavelength(self) -> float:
         """Get wavelength in cm for the IF frequency"""
+        if self._wavelength is not None:
+            return self._wavelength
         if self._frequency == 0:
             logger.error("IF frequency cannot be zero for wavelength calculation")
             raise ValueError("IF frequency cannot be zero for wavelength calculation!")
         wavelength = C_MHZ_CM / self._frequency
-        logger.debug(f"Calculated wavelength={wavelength} cm for IF frequency={self._frequency} MHz")
+        self._wavelength = wavelength
         return wavelength
     
     def set_if(self, freq: float, bandwidth: float, 
@@ -108,36 +111,38 @@ class IF(BaseEntity):
         
         self._frequency = freq
         self._bandwidth = bandwidth
-        self._polarization = self._validate_polarizations(polarization).upper() if polarization else None
+        self._wavelength = None
         self.isactive = isactive
-        logger.info(f"Set IF to frequency={freq} MHz, bandwidth={bandwidth} MHz, polarizations={self._polarization}")
+        logger.info("Set IF to frequency=%s MHz, bandwidth=%s MHz, polarizations=%s", freq, bandwidth, self._polarizations)
 
     def set_frequency(self, freq: float) -> None:
         """Set IF frequency value in MHz"""
         check_positive(freq, "Frequency")
         self._frequency = freq
-        logger.info(f"Set IF frequency to {freq} MHz for IF")
+        self._wavelength = None
+        logger.info("Set IF frequency to %s MHz for IF", freq)
 
     def set_bandwidth(self, bandwidth: float) -> None:
         """Set IF bandwidth value in MHz"""
         check_positive(bandwidth, "Bandwidth")
         self._bandwidth = bandwidth
-        logger.info(f"Set IF bandwidth to {bandwidth} MHz for IF")
+        logger.info("Set IF bandwidth to %s MHz for IF", bandwidth)
     
     def set_polarization(self, polarization: Union[str, List[str]]) -> None:
         """Set IF polarization value(s)"""
         self._polarizations = self._validate_polarizations(polarization)
-        logger.info(f"Set IF polarizations to {self._polarizations} for IF")
+        logger.info("Set IF polarizations to %s for IF", self._polarizations)
 
     def set_frequency_wavelength(self, wavelength_cm: float) -> None:
         """Set IF frequency value in MHz through wavelength value in cm"""
         check_positive(wavelength_cm, "Wavelength")
         self._frequency = C_MHZ_CM / wavelength_cm
-        logger.info(f"Set IF frequency to {self._frequency} MHz from wavelength={wavelength_cm} cm for IF")
+        self._wavelength = wavelength_cm  # already known, no need to divide back on the next read
+        logger.info("Set IF frequency to %s MHz from wavelength=%s cm for IF", self._frequency, wavelength_cm)
 
     def to_dict(self) -> dict:
         """Convert IF object to a dictionary for serialization"""
-        logger.info(f"Converted IF (frequency={self._frequency} MHz) to dictionary")
+        logger.debug("Converted IF (frequency=%s MHz) to dictionary", self._frequency)
         return {
             "frequency": self._frequency,
             "bandwidth": self._bandwidth,
@@ -148,7 +153,7 @@ class IF(BaseEntity):
     @classmethod
     def from_dict(cls, data: dict) -> 'IF':
         """Create an IF object from a dictionary"""
-        logger.info(f"Created IF from dictionary with frequency={data['frequency']} MHz")
+        logger.debug("Created IF from dictionary with frequency=%s MHz", data["frequency"])
         return cls(
             freq=data["frequency"],
             bandwidth=data["bandwidth"],
@@ -187,12 +192,11 @@ class IF(BaseEntity):
             raise ValueError(f"Polarizations {polarizations} must belong to a single group: "
                             f"either {CIRCULAR_POLARIZATIONS}, {PAIRED_LINEAR_POLARIZATIONS}, or {SINGLE_LINEAR_POLARIZATIONS}")
 
-        logger.debug(f"Validated polarizations {polarizations} as {group}")
+        logger.debug("Validated polarizations %s as %s", polarizations, group)
         return polarizations  
 
     def __repr__(self) -> str:
         """Return a string representation of IF"""
-        logger.debug(f"Generated string representation for IF with frequency={self._frequency} MHz")
         return (f"IF(frequency={self._frequency} MHz, bandwidth={self._bandwidth} MHz, "
                 f"polarizations={self._polarizations}, isactive={self.isactive})")
 
@@ -205,8 +209,10 @@ class IF(BaseEntity):
     Methods:
         add_IF
         create_IF
+        create_IFs
         insert_IF
         remove_IF
+        remove_IFs
         set_IF
 
         get_by_index
@@ -216,6 +222,8 @@ class IF(BaseEntity):
         get_bandwidths
         get_polarizations
         get_wavelengths
+        get_active_wavelengths_in_band
+        get_wavelength_spans
         get_active_frequencies
         get_inactive_frequencies
         
@@ -232,6 +240,11 @@ class IF(BaseEntity):
         to_dict
         from_dict
         _check_overlap
+        _check_overlap_batch
+        _check_finite_wavelengths
+        _frequency_array
+        _bandwidth_array
+        _active_mask
         __len__
         __init__
         __repr__
@@ -244,7 +257,7 @@ class Frequencies(BaseEntity):
         if ifs is not None:
             check_list_type(ifs, IF, "IFs")
         self._data = ifs if ifs is not None else []
-        logger.info(f"Initialized Frequencies with {len(self._data)} IFs")
+        logger.info("Initialized Frequencies with %s IFs", len(self._data))
 
     def add_IF(self, if_obj: IF) -> None:
         """Add a new IF object
@@ -258,7 +271,7 @@ class Frequencies(BaseEntity):
         check_type(if_obj, IF, "IF")
         self._check_overlap(if_obj)
         self._data.append(if_obj)
-        logger.info(f"Added IF with frequency={if_obj.get_frequency()} MHz, bandwidth={if_obj.get_bandwidth()} MHz to Frequencies")
+        logger.info("Added IF with frequency=%s MHz, bandwidth=%s MHz to Frequencies", if_obj.get_frequency(), if_obj.get_bandwidth())
     
     def create_IF(self, freq: float = 1000.0, bandwidth: float = 16.0, 
               polarization: Optional[str] = None, isactive: bool = True) -> None:
@@ -286,8 +299,40 @@ class Frequencies(BaseEntity):
 
         # add the new IF to the collection
         self._data.append(new_if)
-        logger.info(f"Created and added IF with frequency={freq} MHz, bandwidth={bandwidth} MHz, "
-                    f"polarizations={new_if.get_polarization()} to Frequencies")
+        logger.info("Created and added IF with frequency=%s MHz, bandwidth=%s MHz, polarizations=%s to Frequencies",
+                    freq, bandwidth, new_if._polarizations)
+
+    def create_IFs(self, freqs: Union[List[float], np.ndarray], bandwidths: Union[List[float], np.ndarray],
+                   polarization: Optional[str] = None, isactive: bool = True) -> None:
+        """Create and add several IF objects to the Frequencies collection at once.
+
+        Args:
+            freqs (list[float] | np.ndarray): Frequencies in MHz
+            bandwidths (list[float] | np.ndarray): Bandwidths in MHz, one per frequency
+            polarization (str, optional): Polarization type for all new IFs
+            isactive (bool): Whether the new IFs are active (default: True)
+
+        Raises:
+            ValueError: If the inputs differ in shape, are not positive, or any frequency range overlaps
+        """
+        freqs = np.asarray(freqs, dtype=np.float64)
+        bandwidths = np.asarray(bandwidths, dtype=np.float64)
+        if freqs.ndim != 1 or freqs.shape != bandwidths.shape:
+            logger.error(f"Frequencies and bandwidths must be 1D of equal length, got shapes {freqs.shape} and {bandwidths.shape}")
+            raise ValueError("Frequencies and bandwidths must be 1D of equal length!")
+        if not (freqs > 0).all():
+            logger.error("All frequencies must be positive")
+            raise ValueError("All frequencies must be positive!")
+        if not (bandwidths > 0).all():
+            logger.error("All bandwidths must be positive")
+            raise ValueError("All bandwidths must be positive!")
+
+        # check for frequency overlap in one pass over the whole batch
+        self._check_overlap_batch(freqs, bandwidths)
+
+        self._data.extend(IF(freq=freq, bandwidth=bw, polarization=polarization, isactive=isactive)
+                          for freq, bw in zip(freqs.tolist(), bandwidths.tolist()))
+        logger.info("Created and added %s IFs to Frequencies", freqs.size)
     
     def insert_IF(self, index: int, if_obj: 'IF') -> None:
         """Insert a new IF object at the specified index
@@ -309,16 +354,41 @@ class Frequencies(BaseEntity):
         
         self._check_overlap(if_obj)
         self._data.insert(index, if_obj)
-        logger.info(f"Inserted IF with frequency={if_obj.get_frequency()} MHz, bandwidth={if_obj.get_bandwidth()} MHz at index {index} in Frequencies")
+        logger.info("Inserted IF with frequency=%s MHz, bandwidth=%s MHz at index %s in Frequencies", if_obj.get_frequency(), if_obj.get_bandwidth(), index)
 
     def remove_IF(self, index: int) -> None:
         """Remove IF by index"""
         try:
             self._data.pop(index)
-            logger.info(f"Removed IF at index {index} from Frequencies")
+            logger.info("Removed IF at index %s from Frequencies", index)
         except IndexError:
             logger.error(f"Invalid IF index: {index}")
             raise IndexError("Invalid IF index!")
+
+    def remove_IFs(self, indices: List[int]) -> None:
+        """Remove several IFs by index in a single pass
+
+        The remaining IFs keep their relative order, since scans refer to IFs by position.
+
+        Args:
+            indices (list[int]): Indices of the IFs to remove
+
+        Raises:
+            TypeError: If indices is not a list of integers
+            IndexError: If any index is out of range
+        """
+        check_list_type(indices, int, "IF indices")
+        n = len(self._data)
+        for index in indices:
+            if isinstance(index, bool):
+                logger.error(f"IF index must be an integer, got {index!r}")
+                raise TypeError(f"IF index must be an integer, got {index!r}")
+            if not -n <= index < n:
+                logger.error(f"Invalid IF index: {index}")
+                raise IndexError("Invalid IF index!")
+        removed = {index % n for index in indices}
+        self._data = [if_obj for i, if_obj in enumerate(self._data) if i not in removed]
+        logger.info("Removed %s IFs from Frequencies", n - len(self._data))
         
     def set_IF(self, if_obj: IF, index: int) -> None:
         """ Replace IF data with index with new IF"""
@@ -342,36 +412,71 @@ class Frequencies(BaseEntity):
         """Get list of IF objects"""
         return self._data
         
-    def get_frequencies(self) -> list[float]:
-        """Get list of IF frequencies in MHz"""
-        logger.debug(f"Retrieved IF frequencies with {len(self._data)} items")
-        return [if_obj.get_frequency() for if_obj in self._data]
+    def get_frequencies(self) -> np.ndarray:
+        """Get array of IF frequencies in MHz (a fresh array, safe to modify)"""
+        logger.debug("Retrieved IF frequencies with %s items", len(self._data))
+        return self._frequency_array()
 
-    def get_bandwidths(self) -> list[float]:
-        """Get list of IF bandwidths in MHz"""
-        logger.debug(f"Retrieved IF bandwidths with {len(self._data)} items")
-        return [if_obj.get_bandwidth() for if_obj in self._data]
+    def get_bandwidths(self) -> np.ndarray:
+        """Get array of IF bandwidths in MHz (a fresh array, safe to modify)"""
+        logger.debug("Retrieved IF bandwidths with %s items", len(self._data))
+        return self._bandwidth_array()
 
     def get_polarizations(self) -> list[Optional[str]]:
         """Get list of IF polarizations"""
-        logger.debug(f"Retrieved polarizations with {len(self._data)} items")
-        return [if_obj.get_polarization() for if_obj in self._data]
+        logger.debug("Retrieved polarizations with %s items", len(self._data))
+        return [if_obj._polarizations for if_obj in self._data]
     
-    def get_wavelengths(self) -> list[float]:
-        """Get list of IF wavelengths in cm"""
-        logger.debug(f"Retrieved IF wavelengths with {len(self._data)} items")
-        return [if_obj.get_frequency_wavelength() for if_obj in self._data]
+    def get_wavelengths(self) -> np.ndarray:
+        """Get array of IF wavelengths in cm"""
+        # divide unconditionally and look for inf afterwards instead of pre-scanning for zeros
+        with np.errstate(divide="ignore"):
+            wavelengths = C_MHZ_CM / self._frequency_array()
+        self._check_finite_wavelengths(wavelengths)
+        logger.debug("Calculated wavelengths for %s IFs", wavelengths.size)
+        return wavelengths
+
+    def get_active_wavelengths_in_band(self, freq_min: float, freq_max: float) -> np.ndarray:
+        """Get wavelengths in cm of active IFs whose frequency lies within [freq_min, freq_max] MHz
+
+        Args:
+            freq_min (float): Lower frequency bound in MHz (inclusive)
+            freq_max (float): Upper frequency bound in MHz (inclusive)
+
+        Raises:
+            ValueError: If freq_min is greater than freq_max
+        """
+        if freq_min > freq_max:
+            logger.error(f"Invalid frequency band [{freq_min}, {freq_max}] MHz")
+            raise ValueError(f"freq_min ({freq_min}) must not exceed freq_max ({freq_max})!")
+        freqs = self._frequency_array()
+        # one combined mask, then a single division over the selected IFs only
+        selected = freqs[self._active_mask() & (freqs >= freq_min) & (freqs <= freq_max)]
+        wavelengths = C_MHZ_CM / selected
+        logger.debug("Calculated wavelengths for %s active IFs in band [%s, %s] MHz", wavelengths.size, freq_min, freq_max)
+        return wavelengths
+
+    def get_wavelength_spans(self) -> np.ndarray:
+        """Get array of IF wavelength spans in cm, i.e. C/freq - C/(freq + bandwidth)"""
+        freqs = self._frequency_array()
+        bandwidths = self._bandwidth_array()
+        # C/f - C/(f+b) == C*b / (f*(f+b)): one division instead of two
+        with np.errstate(divide="ignore"):
+            spans = C_MHZ_CM * bandwidths / (freqs * (freqs + bandwidths))
+        self._check_finite_wavelengths(spans)
+        logger.debug("Calculated wavelength spans for %s IFs", spans.size)
+        return spans
 
     def get_active_frequencies(self) -> list[IF]:
         """Get active IF frequencies"""
         active = [if_obj for if_obj in self._data if if_obj.isactive]
-        logger.debug(f"Retrieved {len(active)} active frequencies")
+        logger.debug("Retrieved %s active frequencies", len(active))
         return active
 
     def get_inactive_frequencies(self) -> list[IF]:
         """Get inactive IF frequencies"""
         inactive = [if_obj for if_obj in self._data if not if_obj.isactive]
-        logger.debug(f"Retrieved {len(inactive)} inactive frequencies")
+        logger.debug("Retrieved %s inactive frequencies", len(inactive))
         return inactive
 
     def activate_IF(self, index: int) -> None:
@@ -381,7 +486,7 @@ class Frequencies(BaseEntity):
             self._data[index].activate()
             if hasattr(self, '_parent') and self._parent:  # Проверяем наличие родителя
                 self._parent._sync_scans_with_activation("frequencies", index, True)
-            logger.info(f"Activated IF {self._data[index].get_frequency()} MHz at index {index}")
+            logger.info("Activated IF %s MHz at index %s", self._data[index].get_frequency(), index)
         except IndexError:
             logger.error(f"Invalid IF index: {index}")
             raise IndexError("Invalid IF index!")
@@ -393,7 +498,7 @@ class Frequencies(BaseEntity):
             self._data[index].deactivate()
             if hasattr(self, '_parent') and self._parent:  # Проверяем наличие родителя
                 self._parent._sync_scans_with_activation("frequencies", index, False)
-            logger.info(f"Deactivated IF {self._data[index].get_frequency()} MHz at index {index}")
+            logger.info("Deactivated IF %s MHz at index %s", self._data[index].get_frequency(), index)
         except IndexError:
             logger.error(f"Invalid IF index: {index}")
             raise IndexError("Invalid IF index!")
@@ -403,9 +508,10 @@ class Frequencies(BaseEntity):
         if not self._data:
             logger.error("No IFs to activate")
             raise ValueError("No IFs to activate!")
+        # flip the flags directly: activate() would log once per IF
         for if_obj in self._data:
-            if_obj.activate()
-        logger.info("Activated all IFs")
+            if_obj.isactive = True
+        logger.info("Activated all %s IFs", len(self._data))
 
     def deactivate_all(self) -> None:
         """Deactivate all IF"""
@@ -413,8 +519,8 @@ class Frequencies(BaseEntity):
             logger.error("No IFs to deactivate")
             raise ValueError("No IFs to deactivate!")
         for if_obj in self._data:
-            if_obj.deactivate()
-        logger.info("Deactivated all IFs")
+            if_obj.isactive = False
+        logger.info("Deactivated all %s IFs", len(self._data))
     
     def drop_active(self) -> None:
         """Remove all active IFs from the Frequencies list
@@ -422,13 +528,14 @@ class Frequencies(BaseEntity):
         Raises:
             ValueError: If there are no active IFs to remove
         """
-        active_ifs = self.get_active_frequencies()
-        if not active_ifs:
+        remaining = [if_obj for if_obj in self._data if not if_obj.isactive]
+        active_count = len(self._data) - len(remaining)
+        if not active_count:
             logger.warning("No active IFs to drop")
             raise ValueError("No active IFs to remove!")
         
-        self._data = [if_obj for if_obj in self._data if not if_obj.isactive]
-        logger.info(f"Dropped {len(active_ifs)} active IFs from Frequencies")
+        self._data = remaining
+        logger.info("Dropped %s active IFs from Frequencies", active_count)
 
     def drop_inactive(self) -> None:
         """Remove all inactive IFs from the Frequencies list
@@ -436,44 +543,96 @@ class Frequencies(BaseEntity):
         Raises:
             ValueError: If there are no inactive IFs to remove
         """
-        inactive_ifs = self.get_inactive_frequencies()
-        if not inactive_ifs:
+        remaining = [if_obj for if_obj in self._data if if_obj.isactive]
+        inactive_count = len(self._data) - len(remaining)
+        if not inactive_count:
             logger.warning("No inactive IFs to drop")
             raise ValueError("No inactive IFs to remove!")
         
-        self._data = [if_obj for if_obj in self._data if if_obj.isactive]
-        logger.info(f"Dropped {len(inactive_ifs)} inactive IFs from Frequencies")
+        self._data = remaining
+        logger.info("Dropped %s inactive IFs from Frequencies", inactive_count)
 
     def clear(self) -> None:
         """Clear IF data"""
-        logger.info(f"Cleared {len(self._data)} IFs from Frequencies")
+        logger.info("Cleared %s IFs from Frequencies", len(self._data))
         self._data.clear()
 
     def to_dict(self) -> dict:
         """Convert Frequencies object to a dictionary for serialization"""
-        logger.info(f"Converted Frequencies with {len(self._data)} IFs to dictionary")
+        logger.info("Converted Frequencies with %s IFs to dictionary", len(self._data))
         return {"data": [if_obj.to_dict() for if_obj in self._data]}
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Frequencies':
         """Create a Frequencies object from a dictionary"""
         ifs = [IF.from_dict(if_data) for if_data in data["data"]]
-        logger.info(f"Created Frequencies with {len(ifs)} IFs from dictionary")
+        logger.info("Created Frequencies with %s IFs from dictionary", len(ifs))
         return cls(ifs=ifs)
 
+    def _check_finite_wavelengths(self, values: np.ndarray) -> None:
+        """Raise if a wavelength computation hit a zero IF frequency (inf in the result)"""
+        zero = np.flatnonzero(np.isinf(values))
+        if zero.size:
+            logger.error(f"IF frequency at index {zero[0]} cannot be zero for wavelength calculation")
+            raise ValueError(f"IF frequency at index {zero[0]} cannot be zero for wavelength calculation!")
+
     def _check_overlap(self, if_obj:IF):
         """Check IF frequency overlapping with existis IF frequencies"""
         new_freq = if_obj.get_frequency()
         new_bw = if_obj.get_bandwidth()
         new_end = new_freq + new_bw
 
-        for existing_if in self._data:
-            ex_freq = existing_if.get_frequency()
-            ex_bw = existing_if.get_bandwidth()
-            ex_end = ex_freq + ex_bw
-            if (new_freq < ex_end and new_end > ex_freq):
-                logger.error(f"Frequency range [{new_freq}, {new_end}] overlaps with existing range [{ex_freq}, {ex_end}]")
-                raise ValueError(f"Frequency range [{new_freq}, {new_end}] overlaps with existing range [{ex_freq}, {ex_end}]")
+        freqs = self._frequency_array()
+        ends = freqs + self._bandwidth_array()
+        overlapping = np.flatnonzero((new_freq < ends) & (new_end > freqs))
+        if overlapping.size:
+            ex_freq = float(freqs[overlapping[0]])
+            ex_end = float(ends[overlapping[0]])
+            logger.error(f"Frequency range [{new_freq}, {new_end}] overlaps with existing range [{ex_freq}, {ex_end}]")
+            raise ValueError(f"Frequency range [{new_freq}, {new_end}] overlaps with existing range [{ex_freq}, {ex_end}]")
+
+    def _check_overlap_batch(self, freqs: np.ndarray, bandwidths: np.ndarray) -> None:
+        """Check new IF frequency ranges against each other and against existing IF frequencies"""
+        ends = freqs + bandwidths
+
+        # sorted by lower edge, a range overlaps an earlier one iff it starts below their highest upper edge
+        order = np.argsort(freqs, kind="stable")
+        sorted_freqs = freqs[order]
+        max_ends = np.maximum.accumulate(ends[order])
+        clash = np.flatnonzero(sorted_freqs[1:] < max_ends[:-1])
+        if clash.size:
+            new_freq = float(sorted_freqs[clash[0] + 1])
+            new_end = float(ends[order][clash[0] + 1])
+            logger.error(f"Frequency range [{new_freq}, {new_end}] overlaps with another new range")
+            raise ValueError(f"Frequency range [{new_freq}, {new_end}] overlaps with another new range")
+
+        ex_freqs = self._frequency_array()
+        if not ex_freqs.size:
+            return
+        ex_ends = ex_freqs + self._bandwidth_array()
+        ex_order = np.argsort(ex_freqs, kind="stable")
+        ex_max_ends = np.maximum.accumulate(ex_ends[ex_order])
+        # existing ranges starting below each new upper edge, and the highest upper edge among them
+        below = np.searchsorted(ex_freqs[ex_order], ends, side="left")
+        clash = np.flatnonzero((below > 0) & (ex_max_ends[np.maximum(below - 1, 0)] > freqs))
+        if clash.size:
+            new_freq, new_end = float(freqs[clash[0]]), float(ends[clash[0]])
+            match = np.flatnonzero((new_freq < ex_ends) & (new_end > ex_freqs))[0]
+            ex_freq, ex_end = float(ex_freqs[match]), float(ex_ends[match])
+            logger.error(f"Frequency range [{new_freq}, {new_end}] overlaps with existing range [{ex_freq}, {ex_end}]")
+            raise ValueError(f"Frequency range [{new_freq}, {new_end}] overlaps with existing range [{ex_freq}, {ex_end}]")
+
+    def _frequency_array(self) -> np.ndarray:
+        """Get IF frequencies in MHz as a float64 array (IF objects stay the storage)"""
+        return np.array([if_obj._frequency for if_obj in self._data], dtype=np.float64)
+
+    def _bandwidth_array(self) -> np.ndarray:
+        """Get IF bandwidths in MHz as a float64 array"""
+        return np.array([if_obj._bandwidth for if_obj in self._data], dtype=np.float64)
+
+    def _active_mask(self) -> np.ndarray:
+        """Get IF activity flags as a boolean mask"""
+        return np.array([if_obj.isactive for if_obj in self._data], dtype=bool)
 
     def __len__(self) -> int:
         """Return the number of IFs in Frequencies"""
@@ -481,6 +640,5 @@ class Frequencies(BaseEntity):
 
     def __repr__(self) -> str:
         """String representation of Frequencies"""
-        active_count = len(self.get_active_frequencies())
-        logger.debug(f"Generated string representation for Frequencies")
+        active_count = len([if_obj for if_obj in self._data if if_obj.isactive])
         return f"Frequencies(count={len(self._data)}, active={active_count}, inactive={len(self._data) - active_count})"
\ No newline at end of file
@@ -1,15 +1,18 @@
 # base/observation.py
-from base.base_entity import BaseEntity
-from base.sources import Sources
-from base.telescopes import Telescopes
-from base.frequencies import Frequencies
+from base.base_entity import BaseEntity, _get_isactive
+from base.sources import Source, Sources
+from base.telescopes import Telescope, SpaceTelescope, Telescopes
+from base.frequencies import IF, Frequencies
 from base.scans import Scans
-from utils.validation import check_type, check_non_empty_string
+from utils.validation import check_type, check_non_empty_string, check_list_type
 from utils.logging_setup import logger
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Callable
+from itertools import chain
+from operator import attrgetter
 import astropy.units as u
 import numpy as np
+import json
 
 """Base-class of an Observation object with start_time, sources, telescopes, frequencies and scans
 
@@ -37,6 +40,9 @@ import numpy as np
         set_calculated_data
         set_calculated_data_by_key
 
+        insert_sources
+        insert_telescopes
+        insert_frequencies
 
         get_observation_type
         get_observation_code
@@ -52,23 +58,62 @@ import numpy as np
         validate
 
         to_dict
+        to_json
         from_dict
 
+        _adopt
+        _insert_entities
         _update_scan_indices
         _sync_scans_with_activation
+        _to_dict
 
         __init__
         __repr__
     """
 
+# accepted observation types; a tuple so unhashable input still reaches the ValueError below
+_OBSERVATION_TYPES = ("VLBI", "SINGLE_DISH")
+
+# scan attributes and setters holding the indices of each entity type referenced by scans
+_SCAN_INDEX_ATTR = {"sources": "_source_index", "telescopes": "_telescope_indices", "frequencies": "_frequency_indices"}
+_SCAN_ORIGINAL_ATTR = {"telescopes": "_original_telescope_indices", "frequencies": "_original_frequency_indices"}
+_SCAN_INDEX_SETTER = {"sources": "set_source_index", "telescopes": "set_telescope_indices",
+                      "frequencies": "set_frequency_indices"}
+
+_get_start = attrgetter("_start")
+
+def _flatten_indices(index_lists: List[List[int]]) -> tuple[np.ndarray, np.ndarray]:
+    """Stage per-scan index lists into one flat int64 array plus the length of each list"""
+    lengths = np.fromiter(map(len, index_lists), dtype=np.intp, count=len(index_lists))
+    flat = np.fromiter(chain.from_iterable(index_lists), dtype=np.int64, count=int(lengths.sum()))
+    return flat, lengths
+
+def _lists_containing(index_lists: List[List[int]], index: int) -> np.ndarray:
+    """Boolean mask of the index lists that contain index, computed in one pass over all lists"""
+    flat, lengths = _flatten_indices(index_lists)
+    owners = np.repeat(np.arange(len(index_lists)), lengths)
+    return np.bincount(owners[flat == index], minlength=len(index_lists)) > 0
+
+class _QuantityEncoder(json.JSONEncoder):
+    """JSON encoder for the astropy Quantities and NumPy values kept in calculated data"""
+    def default(self, obj):
+        if isinstance(obj, u.Quantity):
+            return obj.value.tolist()
+        if isinstance(obj, (np.ndarray, np.generic)):
+            return obj.tolist()
+        return super().default(obj)
+
 class Observation(BaseEntity):
+    __slots__ = ("_observation_code", "_observation_type", "_sources", "_telescopes",
+                 "_frequencies", "_scans", "_calculated_data")
+
     def __init__(self, observation_code: str = "OBS_DEFAULT", sources: Sources = None,
                  telescopes: Telescopes = None, frequencies: Frequencies = None,
                  scans: Scans = None, observation_type: str = "VLBI", isactive: bool = True):
         """Initialize an Observation object"""
         super().__init__(isactive)
         check_type(observation_code, str, "Observation code")
-        if observation_type not in ("VLBI", "SINGLE_DISH"):
+        if observation_type not in _OBSERVATION_TYPES:
             logger.error(f"Observation type must be 'VLBI' or 'SINGLE_DISH', got {observation_type}")
             raise ValueError(f"Observation type must be 'VLBI' or 'SINGLE_DISH', got {observation_type}")
         if sources is not None:
@@ -81,23 +126,19 @@ class Observation(BaseEntity):
             check_type(scans, Scans, "Scans")
         self._observation_code = observation_code
         self._observation_type = observation_type
-        self._sources = sources if sources is not None else Sources()
-        self._telescopes = telescopes if telescopes is not None else Telescopes()
-        self._frequencies = frequencies if frequencies is not None else Frequencies()
-        self._scans = scans if scans is not None else Scans()
-        self._sources._parent = self
-        self._telescopes._parent = self
-        self._frequencies._parent = self
-        self._scans._parent = self
+        self._sources = self._adopt(sources if sources is not None else Sources())
+        self._telescopes = self._adopt(telescopes if telescopes is not None else Telescopes())
+        self._frequencies = self._adopt(frequencies if frequencies is not None else Frequencies())
+        self._scans = self._adopt(scans if scans is not None else Scans())
         self._calculated_data: Dict[str, Any] = {} # Хранилище для результатов Calculator
-        logger.info(f"Initialized Observation '{observation_code}' with type '{observation_type}'")
+        logger.info("Initialized Observation '%s' with type '%s'", observation_code, observation_type)
 
     def set_observation(self, observation_code: str, sources: Sources = None,
                         telescopes: Telescopes = None, frequencies: Frequencies = None,
                         scans: Scans = None, observation_type: str = "VLBI", isactive: bool = True) -> None:
         """Set observation parameters"""
         check_type(observation_code, str, "Observation code")
-        if observation_type not in ("VLBI", "SINGLE_DISH"):
+        if observation_type not in _OBSERVATION_TYPES:
             logger.error(f"Observation type must be 'VLBI' or 'SINGLE_DISH', got {observation_type}")
             raise ValueError(f"Observation type must be 'VLBI' or 'SINGLE_DISH', got {observation_type}")
         if sources is not None:
@@ -110,13 +151,13 @@ class Observation(BaseEntity):
             check_type(scans, Scans, "Scans")
         self._observation_code = observation_code
         self._observation_type = observation_type
-        self._sources = sources if sources is not None else Sources()
-        self._telescopes = telescopes if telescopes is not None else Telescopes()
-        self._frequencies = frequencies if frequencies is not None else Frequencies()
-        self._scans = scans if scans is not None else Scans()
+        self._sources = self._adopt(sources if sources is not None else Sources())
+        self._telescopes = self._adopt(telescopes if telescopes is not None else Telescopes())
+        self._frequencies = self._adopt(frequencies if frequencies is not None else Frequencies())
+        self._scans = self._adopt(scans if scans is not None else Scans())
         self.isactive = isactive
         self._calculated_data.clear()
-        logger.info(f"Set observation '{observation_code}' with type '{observation_type}'")
+        logger.info("Set observation '%s' with type '%s'", observation_code, observation_type)
     
     def activate(self) -> None:
         """Activate observation"""
@@ -129,56 +170,95 @@ class Observation(BaseEntity):
     def set_observation_type(self, observation_type: str) -> None:
         """Set observation type (VLBI or SINGLE_DISH)"""
         check_type(observation_type, str, "Observation type")
-        if observation_type not in ("VLBI", "SINGLE_DISH"):
+        if observation_type not in _OBSERVATION_TYPES:
             logger.error(f"Observation type must be 'VLBI' or 'SINGLE_DISH', got {observation_type}")
             raise ValueError(f"Observation type must be 'VLBI' or 'SINGLE_DISH', got {observation_type}")
         self._observation_type = observation_type
-        logger.info(f"Set observation type to '{observation_type}' for observation '{self._observation_code}'")
+        logger.info("Set observation type to '%s' for observation '%s'", observation_type, self._observation_code)
 
     def set_observation_code(self, observation_code: str) -> None:
         """Set observation code"""
         check_type(observation_code, str, "Observation code")
         self._observation_code = observation_code
-        logger.info(f"Set observation code to '{observation_code}'")
+        logger.info("Set observation code to '%s'", observation_code)
 
     def set_sources(self, sources: Sources) -> None:
         """Set observation sources"""
         check_type(sources, Sources, "Sources")
-        self._sources = sources
+        if sources is self._sources:
+            return  # same container, calculated data stays valid
+        self._sources = self._adopt(sources)
         self._calculated_data.clear()
-        logger.info(f"Set sources for observation '{self._observation_code}'")
+        logger.info("Set sources for observation '%s'", self._observation_code)
 
     def set_frequencies(self, frequencies: Frequencies) -> None:
         """Set observation frequencies with polarizations"""
         check_type(frequencies, Frequencies, "Frequencies")
-        self._frequencies = frequencies
+        if frequencies is self._frequencies:
+            return  # same container, calculated data stays valid
+        self._frequencies = self._adopt(frequencies)
         self._calculated_data.clear()
-        logger.info(f"Set frequencies with polarizations for observation '{self._observation_code}'")
+        logger.info("Set frequencies with polarizations for observation '%s'", self._observation_code)
 
     def set_telescopes(self, telescopes: Telescopes) -> None:
         """Set observation telescopes"""
         check_type(telescopes, Telescopes, "Telescopes")
-        self._telescopes = telescopes
+        if telescopes is self._telescopes:
+            return  # same container, calculated data stays valid
+        self._telescopes = self._adopt(telescopes)
         self._calculated_data.clear()
-        logger.info(f"Set telescopes for observation '{self._observation_code}'")    
+        logger.info("Set telescopes for observation '%s'", self._observation_code)    
 
     def set_scans(self, scans: Scans) -> None:
         """Set observation scans"""
         check_type(scans, Scans, "Scans")
-        self._scans = scans
+        if scans is self._scans:
+            return  # same container, calculated data stays valid
+        self._scans = self._adopt(scans)
         self._calculated_data.clear()  # Очищаем результаты, так как данные изменились
-        logger.info(f"Set scans for observation '{self._observation_code}'")
+        logger.info("Set scans for observation '%s'", self._observation_code)
 
     def set_calculated_data(self, data: Any) -> None:
         """Save calculated data for this observation"""
         self._calculated_data = data.copy()
-        logger.info(f"Stored calculated data for observation '{self._observation_code}'")
+        logger.info("Stored calculated data for observation '%s'", self._observation_code)
 
     def set_calculated_data_by_key(self, key: str, data: Any) -> None:
         """Save concrete calculated data for this observation"""
         check_non_empty_string(key, "Key")
         self._calculated_data[key] = data
-        logger.info(f"Stored calculated data '{key}' for observation '{self._observation_code}'")
+        logger.info("Stored calculated data '%s' for observation '%s'", key, self._observation_code)
+
+    def insert_sources(self, index: int, sources: List[Source]) -> None:
+        """Insert several sources at index, shifting scan source indices in a single pass
+
+        Raises:
+            IndexError: If the index is out of range
+            ValueError: If any source is a duplicate (nothing is inserted then)
+        """
+        check_list_type(sources, Source, "Sources")
+        self._insert_entities("sources", self._sources.insert_source, self._sources.get_all_sources(), index, sources)
+
+    def insert_telescopes(self, index: int, telescopes: List[Telescope | SpaceTelescope]) -> None:
+        """Insert several telescopes at index, shifting scan telescope indices in a single pass
+
+        Raises:
+            IndexError: If the index is out of range
+            ValueError: If any telescope is a duplicate (nothing is inserted then)
+        """
+        check_list_type(telescopes, (Telescope, SpaceTelescope), "Telescopes")
+        self._insert_entities("telescopes", self._telescopes.insert_telescope,
+                              self._telescopes.get_all_telescopes(), index, telescopes)
+
+    def insert_frequencies(self, index: int, ifs: List[IF]) -> None:
+        """Insert several IFs at index, shifting scan frequency indices in a single pass
+
+        Raises:
+            IndexError: If the index is out of range
+            ValueError: If any IF overlaps an existing or another new IF (nothing is inserted then)
+        """
+        check_list_type(ifs, IF, "IFs")
+        self._insert_entities("frequencies", self._frequencies.insert_IF, self._frequencies.get_all_IF(), index, ifs)
 
     def get_observation_code(self) -> str:
         """Get observation code"""
@@ -211,7 +291,7 @@ class Observation(BaseEntity):
     def get_calculated_data_by_key(self, key: str) -> Any:
         """Get concrete calculated data by key for this observation"""
         check_non_empty_string(key, "Key")
-        logger.info(f"Retrieved calculated data '{key}' for observation '{self._observation_code}'")
+        logger.debug("Retrieved calculated data '%s' for observation '%s'", key, self._observation_code)
         return self._calculated_data.get(key)
 
     def get_start_datetime(self) -> Optional[datetime]:
@@ -219,7 +299,8 @@ class Observation(BaseEntity):
         active_scans = self._scans.get_active_scans(self)  # Передаем self
         if not active_scans:
             return None
-        return min(scan.get_start_datetime() for scan in active_scans)
+        # pick the earliest scan by raw timestamp, build a datetime only for it
+        return min(active_scans, key=_get_start).get_start_datetime()
     
     def validate(self) -> bool:
         """Validate the observation parameters"""
@@ -230,139 +311,176 @@ class Observation(BaseEntity):
             return False
 
         # check observation type
-        if self._observation_type not in ["VLBI", "SINGLE_DISH"]:
+        if self._observation_type not in _OBSERVATION_TYPES:
             logger.error(f"Invalid observation type: {self._observation_type}. Must be 'VLBI' or 'SINGLE_DISH'")
             return False
 
-        # validate sources
-        if not self._sources.get_active_sources():
+        # validate sources; any() stops at the first active entity instead of building the active lists
+        if not any(map(_get_isactive, self._sources.get_all_sources())):
             logger.error("No active sources defined in observation")
             return False
 
         # validate telescopes
-        if not self._telescopes.get_active_telescopes():
+        if not any(map(_get_isactive, self._telescopes.get_all_telescopes())):
             logger.error("No active telescopes defined in observation")
             return False
 
         # validate frequencies
-        if not self._frequencies.get_active_frequencies():
+        if not any(map(_get_isactive, self._frequencies.get_all_IF())):
             logger.error("No active frequencies defined in observation")
             return False
 
-        # validate scans
-        if not self._scans.get_active_scans(self):
+        # validate scans; the filtered list is computed once and reused for the temporal checks
+        active_scans = self._scans.get_active_scans(self)
+        if not active_scans:
             logger.error("No active scans defined in observation")
             return False
 
         # check temporal consistency of scans
-        active_scans = sorted(self._scans.get_active_scans(), key=lambda x: x.get_start())
-        telescope_scans = {}
+        tel_codes = {}
+        tel_ids, starts, ends = [], [], []
         for scan in active_scans:
             scan_start = scan.get_start()
             scan_end = scan_start + scan.get_duration()
             
             # check telescope availability for scan
-            if not scan.check_telescope_availability(self):
+            availability = scan.check_telescope_availability(self)
+            if not availability:
                 logger.error(f"Telescope availability check failed for scan starting at {scan_start}")
                 return False
 
-            # check time overlap for telescopes
-            for telescope in scan.get_telescopes(self).get_active_telescopes():
-                tel_code = telescope.get_code()
-                if tel_code not in telescope_scans:
-                    telescope_scans[tel_code] = []
-                for prev_start, prev_end in telescope_scans[tel_code]:
-                    if not (scan_end <= prev_start or scan_start >= prev_end):
-                        logger.error(f"Scan overlap detected for telescope {tel_code}: "
-                                    f"[{prev_start}, {prev_end}] vs [{scan_start}, {scan_end}]")
-                        return False
-                telescope_scans[tel_code].append((scan_start, scan_end))
-
-        logger.info(f"Observation '{self._observation_code}' validated successfully")
+            # collect one (telescope, start, end) interval per scan telescope; the availability
+            # map is already keyed by the codes of the scan's active telescopes
+            for code in availability:
+                tel_ids.append(tel_codes.setdefault(code, len(tel_codes)))
+                starts.append(scan_start)
+                ends.append(scan_end)
+
+        # check time overlap for telescopes: once intervals are sorted by (telescope, start),
+        # any overlap also shows up between two neighbours, so only adjacent pairs are compared
+        tel_ids = np.asarray(tel_ids, dtype=np.intp)
+        starts = np.asarray(starts, dtype=np.float64)
+        ends = np.asarray(ends, dtype=np.float64)
+        order = np.lexsort((starts, tel_ids))
+        tel_ids, starts, ends = tel_ids[order], starts[order], ends[order]
+        clashes = np.flatnonzero((tel_ids[1:] == tel_ids[:-1]) & (starts[1:] < ends[:-1]))
+        if clashes.size:
+            i = clashes[0] + 1
+            tel_code = list(tel_codes)[tel_ids[i]]
+            logger.error(f"Scan overlap detected for telescope {tel_code}: "
+                        f"[{starts[i - 1]}, {ends[i - 1]}] vs [{starts[i]}, {ends[i]}]")
+            return False
+
+        logger.info("Observation '%s' validated successfully", self._observation_code)
         return True
     
-    def _update_scan_indices(self, entity_type: str, removed_index: Optional[int] = None, inserted_index: Optional[int] = None) -> None:
-        """Update scan indices after adding/removing sources, telescopes, or frequencies."""
-        entity_map = {"sources": "_source_index", "telescopes": "_telescope_indices", "frequencies": "_frequency_indices"}
-        if entity_type not in entity_map:
+    def _adopt(self, container: Any) -> Any:
+        """Make this observation the parent of a container so its activation changes reach the scans"""
+        if getattr(container, "_parent", None) is not self:
+            container._parent = self
+        return container
+
+    def _insert_entities(self, entity_type: str, insert: Callable[[int, Any], None], data: list,
+                         index: int, items: list) -> None:
+        """Insert items one by one through the container, then remap scan indices once for all of them"""
+        inserted = 0
+        try:
+            for item in items:
+                insert(index + inserted, item)
+                inserted += 1
+        except (TypeError, ValueError, IndexError):
+            del data[index:index + inserted]  # roll back the partial insert, scans were not touched yet
+            raise
+        if inserted:
+            self._update_scan_indices(entity_type, inserted_index=index, count=inserted)
+            self._calculated_data.clear()
+        logger.info("Inserted %s %s at index %s in observation '%s'", inserted, entity_type, index, self._observation_code)
+
+    def _update_scan_indices(self, entity_type: str, removed_index: Optional[int] = None, inserted_index: Optional[int] = None,
+                             count: int = 1) -> None:
+        """Update scan indices after adding/removing sources, telescopes, or frequencies.
+
+        count is the number of entities inserted at inserted_index (ignored for removal).
+        """
+        if entity_type not in _SCAN_INDEX_ATTR:
             raise ValueError(f"Invalid entity type: {entity_type}")
-        attr = entity_map[entity_type]
-        
-        for scan in self._scans.get_all_scans():
-            if entity_type == "sources":
-                current_idx = getattr(scan, attr)
-                if removed_index is not None and current_idx is not None:
-                    if current_idx == removed_index:
-                        scan.set_source_index(None)  # Источник удалён, сбрасываем
-                        scan.is_off_source = True
-                    elif current_idx > removed_index:
-                        scan.set_source_index(current_idx - 1)
-                elif inserted_index is not None and current_idx is not None and current_idx >= inserted_index:
-                    scan.set_source_index(current_idx + 1)
-            else:  # telescopes or frequencies
-                current_indices = getattr(scan, attr)
-                updated_indices = []
-                for idx in current_indices:
-                    if removed_index is not None:
-                        if idx == removed_index:
-                            continue  # Пропускаем удалённый индекс
-                        elif idx > removed_index:
-                            updated_indices.append(idx - 1)
-                        else:
-                            updated_indices.append(idx)
-                    elif inserted_index is not None:
-                        if idx >= inserted_index:
-                            updated_indices.append(idx + 1)
-                        else:
-                            updated_indices.append(idx)
-                if removed_index is not None or inserted_index is not None:
-                    if entity_type == "telescopes":
-                        scan.set_telescope_indices(updated_indices)
-                    else:
-                        scan.set_frequency_indices(updated_indices)
-        logger.debug(f"Updated scan indices for {entity_type} in observation '{self._observation_code}'")
+        attr = _SCAN_INDEX_ATTR[entity_type]
+        setter = _SCAN_INDEX_SETTER[entity_type]
+        scans = self._scans.get_all_scans()
+
+        if entity_type == "sources":
+            # one vectorized remap over all scans, then touch only the scans whose index changed
+            source_indices = list(map(attrgetter(attr), scans))
+            has_source = np.fromiter((idx is not None for idx in source_indices), dtype=bool, count=len(scans))
+            current = np.fromiter((idx or 0 for idx in source_indices), dtype=np.int64, count=len(scans))
+            updated = current.copy()
+            if removed_index is not None:
+                for i in np.flatnonzero(has_source & (current == removed_index)):
+                    scans[i].set_source_index(None)  # Источник удалён, сбрасываем
+                    scans[i].is_off_source = True
+                updated[has_source & (current > removed_index)] -= 1
+            elif inserted_index is not None:
+                updated[has_source & (current >= inserted_index)] += count
+            for i in np.flatnonzero(updated != current):
+                scans[i].set_source_index(int(updated[i]))
+        elif removed_index is not None or inserted_index is not None:  # telescopes or frequencies
+            # stage every scan's index list into one flat array with segment bounds
+            flat, lengths = _flatten_indices([getattr(scan, attr) for scan in scans])
+            bounds = np.concatenate(([0], np.cumsum(lengths)))
+            if removed_index is not None:
+                keep = flat != removed_index  # Пропускаем удалённый индекс
+                shifted = flat - (flat > removed_index)
+                changed = ~keep | (shifted != flat)
+                new_bounds = np.concatenate(([0], np.cumsum(keep)))[bounds]
+                updated = shifted[keep]
+            else:
+                updated = flat + (flat >= inserted_index) * count
+                changed = updated != flat
+                new_bounds = bounds
+            owners = np.repeat(np.arange(len(scans)), lengths)
+            for i in np.unique(owners[changed]):
+                getattr(scans[i], setter)(updated[new_bounds[i]:new_bounds[i + 1]].tolist())
+        logger.debug("Updated scan indices for %s in observation '%s'", entity_type, self._observation_code)
 
     def _sync_scans_with_activation(self, entity_type: str, index: int, is_active: bool) -> None:
         """Sync scans when an entity (source, telescope, frequency) is activated/deactivated"""
-        entity_map = {"sources": "_source_index", "telescopes": "_telescope_indices", "frequencies": "_frequency_indices"}
-        original_map = {"telescopes": "_original_telescope_indices", "frequencies": "_original_frequency_indices"}
-        if entity_type not in entity_map:
+        if entity_type not in _SCAN_INDEX_ATTR:
             raise ValueError(f"Invalid entity type: {entity_type}")
-        attr = entity_map[entity_type]
+        attr = _SCAN_INDEX_ATTR[entity_type]
         
-        for scan in self._scans.get_all_scans():
-            if entity_type == "sources":
+        if entity_type == "sources":
+            for scan in self._scans.get_all_scans():
                 current_idx = getattr(scan, attr)
                 if current_idx == index:
                     if not is_active:
                         scan.set_source_index(None)
                         scan.is_off_source = True
-                        logger.debug(f"Scan source index reset to None due to deactivation in '{self._observation_code}'")
+                        logger.debug("Scan source index reset to None due to deactivation in '%s'", self._observation_code)
                     elif is_active and scan.is_off_source and current_idx is not None:
                         scan.set_source_index(index)
                         scan.is_off_source = False
-                        logger.debug(f"Scan source index restored to {index} due to activation in '{self._observation_code}'")
-            else:  # telescopes or frequencies
-                current_indices = getattr(scan, attr)
-                original_indices = getattr(scan, original_map[entity_type])  # Используем правильный атрибут
-                if index in current_indices and not is_active:
-                    updated_indices = [i for i in current_indices if i != index]
-                    if entity_type == "telescopes":
-                        scan.set_telescope_indices(updated_indices)
-                    else:
-                        scan.set_frequency_indices(updated_indices)
-                    logger.debug(f"Removed {entity_type} index {index} from scan in '{self._observation_code}'")
-                elif index not in current_indices and is_active:
-                    all_entities = (self._telescopes.get_all_telescopes() if entity_type == "telescopes" 
-                                    else self._frequencies.get_all_frequencies())
-                    if index < len(all_entities) and all_entities[index].isactive:
-                        if index in original_indices:
-                            updated_indices = sorted(current_indices + [index])
-                            if entity_type == "telescopes":
-                                scan.set_telescope_indices(updated_indices)
-                            else:
-                                scan.set_frequency_indices(updated_indices)
-                            logger.debug(f"Added {entity_type} index {index} to scan in '{self._observation_code}'")    
+                        logger.debug("Scan source index restored to %s due to activation in '%s'", index, self._observation_code)
+            return
+
+        # telescopes or frequencies: resolve everything that does not depend on the scan once
+        original_attr = _SCAN_ORIGINAL_ATTR[entity_type]
+        setter = _SCAN_INDEX_SETTER[entity_type]
+        all_entities = (self._telescopes.get_all_telescopes() if entity_type == "telescopes"
+                        else self._frequencies.get_all_IF())
+        can_restore = is_active and index < len(all_entities) and all_entities[index].isactive
+
+        # membership of index is tested for all scans in one pass; only the affected scans are visited
+        scans = self._scans.get_all_scans()
+        contains = _lists_containing([getattr(scan, attr) for scan in scans], index)
+        if not is_active:
+            for i in np.flatnonzero(contains):
+                getattr(scans[i], setter)([idx for idx in getattr(scans[i], attr) if idx != index])
+                logger.debug("Removed %s index %s from scan in '%s'", entity_type, index, self._observation_code)
+        elif can_restore:
+            in_original = _lists_containing([getattr(scan, original_attr) for scan in scans], index)
+            for i in np.flatnonzero(in_original & ~contains):
+                getattr(scans[i], setter)(sorted(getattr(scans[i], attr) + [index]))
+                logger.debug("Added %s index %s to scan in '%s'", entity_type, index, self._observation_code)
 
     def to_dict(self) -> dict:
         """Convert Observation object to a dictionary for serialization"""
@@ -379,7 +497,25 @@ class Observation(BaseEntity):
                 return [convert_quantity(item) for item in obj]
             return obj
 
-        data = {
+        data = self._to_dict(convert_quantity(self._calculated_data))
+        logger.info("Converted observation '%s' to dictionary", self._observation_code)
+        return data
+
+    def to_json(self, **kwargs) -> str:
+        """Serialize Observation to a JSON string
+
+        Calculated data is encoded while streaming, without building a converted copy first.
+
+        Args:
+            **kwargs: Extra keyword arguments passed to json.dumps (e.g. indent)
+        """
+        text = json.dumps(self._to_dict(self._calculated_data), cls=_QuantityEncoder, **kwargs)
+        logger.info("Converted observation '%s' to JSON", self._observation_code)
+        return text
+
+    def _to_dict(self, calculated_data: Any) -> dict:
+        """Build the serialization dictionary around the given calculated data"""
+        return {
             "observation_code": self._observation_code,
             "observation_type": self._observation_type,
             "sources": self._sources.to_dict(),
@@ -387,10 +523,8 @@ class Observation(BaseEntity):
             "frequencies": self._frequencies.to_dict(),
             "scans": self._scans.to_dict(),
             "isactive": self.isactive,
-            "calculated_data": convert_quantity(self._calculated_data) if hasattr(self, '_calculated_data') else {}
+            "calculated_data": calculated_data
         }
-        logger.info(f"Converted observation '{self._observation_code}' to dictionary")
-        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Observation':
@@ -406,7 +540,7 @@ class Observation(BaseEntity):
         )
         if "calculated_data" in data:
             obs._calculated_data = data["calculated_data"]
-        logger.info(f"Created observation '{data['observation_code']}' from dictionary")
+        logger.info("Created observation '%s' from dictionary", data['observation_code'])
         return obs
 
     def __repr__(self) -> str:
@@ -1,6 +1,6 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from base.observation import Observation
-from utils.validation import check_type, check_non_empty_string
+from utils.validation import check_type, check_non_empty_string, check_list_type
 from utils.logging_setup import logger
 
 class Project:
@@ -10,8 +10,8 @@ class Project:
         check_non_empty_string(name, "Project name")
         self._name = name
         self._observations = observations if observations else []
-        for obs in self._observations:
-            check_type(obs, Observation, "Observation in observations list")
+        self._index_by_code: Dict[str, int] = {}  # lazy observation code -> position index for get_by_code
+        check_list_type(self._observations, Observation, "Observations")
         logger.info(f"Initialized Project '{name}' with {len(self._observations)} observations")
 
     def add_observation(self, observation: Observation) -> None:
@@ -19,6 +19,12 @@ class Project:
         check_type(observation, Observation, "Observation")
         self._observations.append(observation)
         logger.info(f"Added observation '{observation.get_observation_code()}' to Project '{self._name}'")
+
+    def add_observations(self, observations: List[Observation]) -> None:
+        """Add several observations to the project with one type check pass and a single extend"""
+        check_list_type(observations, Observation, "Observations")
+        self._observations.extend(observations)
+        logger.info(f"Added {len(observations)} observations to Project '{self._name}'")
     
     def create_observation(self, observation_code: str = "OBS_DEFAULT", isactive: bool = True) -> None:
         """Create and add a new Observation object to the Project.
@@ -30,8 +36,6 @@ class Project:
         Raises:
             ValueError: If the observation_code is not a non-empty string
         """
-        from base.observation import Observation
-        
         # validate observation_code
         check_non_empty_string(observation_code, "Observation code")
         
@@ -49,6 +53,7 @@ class Project:
             logger.error(f"Invalid index {index} for insertion in Project '{self._name}' with {len(self._observations)} observations")
             raise IndexError(f"Index {index} out of range for Project with {len(self._observations)} observations")
         self._observations.insert(index, observation)
+        self._index_by_code.clear()
         logger.info(f"Inserted observation '{observation.get_observation_code()}' at index {index} in Project '{self._name}'")
 
     def remove_observation(self, index: int) -> None:
@@ -57,6 +62,7 @@ class Project:
             logger.error(f"Invalid index {index} for removal in Project '{self._name}' with {len(self._observations)} observations")
             raise IndexError(f"Index {index} out of range for Project with {len(self._observations)} observations")
         obs = self._observations.pop(index)
+        self._index_by_code.clear()
         logger.info(f"Removed observation '{obs.get_observation_code()}' from Project '{self._name}'")
 
     def set_observation(self, observation: Observation, index: int) -> None:
@@ -66,6 +72,7 @@ class Project:
             logger.error(f"Invalid index {index} for setting observation in Project '{self._name}' with {len(self._observations)} observations")
             raise IndexError(f"Index {index} out of range for Project with {len(self._observations)} observations")
         self._observations[index] = observation
+        self._index_by_code.clear()
         logger.info(f"Set observation '{observation.get_observation_code()}' at index {index} in Project '{self._name}'")
 
     def get_by_index(self, index: int) -> Observation:
@@ -74,9 +81,23 @@ class Project:
             logger.error(f"Invalid index {index} for retrieval in Project '{self._name}' with {len(self._observations)} observations")
             raise IndexError(f"Index {index} out of range for Project with {len(self._observations)} observations")
         obs = self._observations[index]
-        logger.info(f"Retrieved observation '{obs.get_observation_code()}' from Project '{self._name}'")
+        logger.debug("Retrieved observation '%s' from Project '%s'", obs.get_observation_code(), self._name)
         return obs
 
+    def get_by_code(self, observation_code: str) -> Optional[Observation]:
+        """Get an observation by its code, or None if the project has no such observation"""
+        index = self._index_by_code.get(observation_code)
+        if index is None or index >= len(self._observations) or \
+                self._observations[index].get_observation_code() != observation_code:
+            # codes can be changed on the observations themselves, so a miss or stale hit rebuilds the index
+            self._index_by_code.clear()
+            for i, obs in enumerate(self._observations):
+                self._index_by_code.setdefault(obs.get_observation_code(), i)
+            index = self._index_by_code.get(observation_code)
+            if index is None:
+                return None
+        return self._observations[index]
+
     def get_observations(self) -> List[Observation]:
         """Get all observations in the project"""
         return self._observations
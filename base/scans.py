@@ -4,7 +4,7 @@ from base.frequencies import Frequencies
 from base.sources import Source
 from base.telescopes import Telescopes, SpaceTelescope
 
-from utils.validation import check_type, check_positive
+from utils.validation import check_type, check_positive, check_list_type
 from utils.logging_setup import logger
 from datetime import datetime
 import numpy as np
@@ -76,7 +76,7 @@ class Scan(BaseEntity):
         self._original_frequency_indices = self._frequency_indices.copy()
         self.is_off_source = source_index is None or is_off_source
         source_str = "OFF SOURCE" if self.is_off_source else f"source_index={source_index}" if source_index is not None else "no source"
-        logger.info(f"Initialized Scan with start={start}, duration={duration}, {source_str}")
+        logger.info("Initialized Scan with start=%s, duration=%s, %s", start, duration, source_str)
     
     def activate(self):
         """Activate scan"""
@@ -171,19 +171,19 @@ class Scan(BaseEntity):
         self.is_off_source = source_index is None or is_off_source
         self.isactive = isactive
         source_str = "OFF SOURCE" if self.is_off_source else f"source_index={source_index}" if source_index is not None else "no source"
-        logger.info(f"Set Scan with start={start}, duration={duration}, {source_str}")
+        logger.info("Set Scan with start=%s, duration=%s, %s", start, duration, source_str)
 
     def set_start(self, start: float) -> None:
         """Set start time of scan"""
         check_type(start, (int, float), "Start time")
         self._start = start
-        logger.info(f"Set scan start to {start}")
+        logger.info("Set scan start to %s", start)
 
     def set_duration(self, duration: float) -> None:
         """Set duration of scan in (s)"""
         check_positive(duration, "Duration")
         self._duration = duration
-        logger.info(f"Set scan duration to {duration}")
+        logger.info("Set scan duration to %s", duration)
 
     def set_source_index(self, source_index: Optional[int], observation: 'Observation' = None) -> None:
         """Set source index for scan"""
@@ -193,7 +193,7 @@ class Scan(BaseEntity):
         self.is_off_source = source_index is None
         if observation:
             self.validate_with_observation(observation)
-        logger.info(f"Set scan source_index to {'OFF SOURCE' if source_index is None else source_index}")
+        logger.info("Set scan source_index to %s", 'OFF SOURCE' if source_index is None else source_index)
 
     def set_telescope_indices(self, telescope_indices: List[int], observation: 'Observation' = None) -> None:
         """Set telescope indices for scan"""
@@ -201,7 +201,7 @@ class Scan(BaseEntity):
         self._telescope_indices = telescope_indices
         if observation:
             self.validate_with_observation(observation)
-        logger.info(f"Set scan telescope_indices to {telescope_indices}")
+        logger.info("Set scan telescope_indices to %s", telescope_indices)
 
     def set_frequency_indices(self, frequency_indices: List[int], observation: 'Observation' = None) -> None:
         """Set frequency indices for scan"""
@@ -209,7 +209,7 @@ class Scan(BaseEntity):
         self._frequency_indices = frequency_indices
         if observation:
             self.validate_with_observation(observation)
-        logger.info(f"Set scan frequency_indices to {frequency_indices}")
+        logger.info("Set scan frequency_indices to %s", frequency_indices)
 
     def validate_with_observation(self, observation: 'Observation') -> bool:
         """Validate scan against an Observation's data"""
@@ -232,7 +232,7 @@ class Scan(BaseEntity):
                 logger.error(f"Invalid frequency_index {idx} for observation with {len(all_freqs)} frequencies")
                 return False
                 
-        logger.debug(f"Validated scan with start={self._start} against observation '{observation.get_observation_code()}'")
+        logger.debug("Validated scan with start=%s against observation '%s'", self._start, observation.get_observation_code())
         return True
     
     def check_telescope_availability(self, observation: 'Observation', time: float = None) -> dict[str, bool]:
@@ -281,11 +281,11 @@ class Scan(BaseEntity):
                 visible = (el_range[0] <= alt_deg <= el_range[1] and 
                            az_range[0] <= az_deg <= az_range[1])
             availability[code] = visible
-        logger.debug(f"Checked telescope availability for scan at time={time}: {availability}")
+        logger.debug("Checked telescope availability for scan at time=%s: %s", time, availability)
         return availability
 
     def to_dict(self) -> dict:
-        logger.info(f"Converted scan with start={self._start} to dictionary")
+        logger.info("Converted scan with start=%s to dictionary", self._start)
         return {
             "start": self._start,
             "duration": self._duration,
@@ -298,7 +298,7 @@ class Scan(BaseEntity):
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Scan':
-        logger.info(f"Created scan with start={data['start']} from dictionary")
+        logger.info("Created scan with start=%s from dictionary", data['start'])
         return cls(
             start=data["start"],
             duration=data["duration"],
@@ -356,11 +356,9 @@ class Scans(BaseEntity):
         """Initialize Scans with a list of Scan objects"""
         super().__init__()
         if scans is not None:
-            check_type(scans, (list, tuple), "Scans")
-            for scan in scans:
-                check_type(scan, Scan, "Scan")
+            check_list_type(scans, Scan, "Scans")
         self._data = scans if scans is not None else []
-        logger.info(f"Initialized Scans with {len(self._data)} scans")
+        logger.info("Initialized Scans with %s scans", len(self._data))
 
     def add_scan(self, scan: 'Scan', observation: 'Observation' = None) -> None:
         """Add a new scan with overlap checking for time and telescopes"""
@@ -373,7 +371,7 @@ class Scans(BaseEntity):
         if overlap:
             logger.error(f"Scan with start={scan.get_start()}, duration={scan.get_duration()} {reason}")
         self._data.append(scan)
-        logger.info(f"Added scan with start={scan.get_start()}, duration={scan.get_duration()} to Scans")
+        logger.info("Added scan with start=%s, duration=%s to Scans", scan.get_start(), scan.get_duration())
     
     def create_scan(self, start: float = 0.0, duration: float = 1.0, source_index: Optional[int] = None,
                 telescope_indices: List[int] = None, frequency_indices: List[int] = None,
@@ -424,7 +422,7 @@ class Scans(BaseEntity):
         # add the new scan to the collection
         self._data.append(new_scan)
         source_str = "OFF SOURCE" if is_off_source else f"source_index={source_index}"
-        logger.info(f"Created and added scan with start={start}, duration={duration}, {source_str} to Scans")
+        logger.info("Created and added scan with start=%s, duration=%s, %s to Scans", start, duration, source_str)
     
     def insert_scan(self, scan: 'Scan', index: int, observation: 'Observation' = None) -> None:
         """Insert a scan at the specified index with overlap checking"""
@@ -442,13 +440,13 @@ class Scans(BaseEntity):
             logger.error(f"Scan with start={scan.get_start()}, duration={scan.get_duration()} {reason}")
             raise ValueError(f"Scan conflicts: {reason}")
         self._data.insert(index, scan)
-        logger.info(f"Inserted scan with start={scan.get_start()} at index {index} in Scans")
+        logger.info("Inserted scan with start=%s at index %s in Scans", scan.get_start(), index)
 
     def remove_scan(self, index: int) -> None:
         """Remove scan by index"""
         try:
             self._data.pop(index)
-            logger.info(f"Removed scan at index {index} from Scans")
+            logger.info("Removed scan at index %s from Scans", index)
         except IndexError:
             logger.error(f"Invalid scan index: {index}")
             raise IndexError("Invalid scan index!")
@@ -466,7 +464,7 @@ class Scans(BaseEntity):
                 logger.error(f"Scan with start={scan.get_start()}, duration={scan.get_duration()} {reason}")
                 raise ValueError(f"Scan conflicts: {reason}")
             self._data[index] = scan
-            logger.info(f"Set scan with start={scan.get_start()} at index {index}")
+            logger.info("Set scan with start=%s at index %s", scan.get_start(), index)
         except IndexError:
             logger.error(f"Invalid scan index: {index}")
             raise IndexError("Invalid scan index!")
@@ -506,14 +504,14 @@ class Scans(BaseEntity):
                    for idx in scan._frequency_indices):
                 continue
             active.append(scan)
-        logger.debug(f"Retrieved {len(active)} active scans" + 
-                     (f" for observation '{observation.get_observation_code()}'" if observation else ""))
+        logger.debug("Retrieved %s active scans%s", len(active),
+                     f" for observation '{observation.get_observation_code()}'" if observation else "")
         return active
 
     def get_inactive_scans(self) -> list[Scan]:
         """Get inactive scans"""
         inactive = [s for s in self._data if not s.isactive]
-        logger.debug(f"Retrieved {len(inactive)} inactive scans")
+        logger.debug("Retrieved %s inactive scans", len(inactive))
         return inactive
     
     def activate_scan(self, index: int) -> None:
@@ -521,7 +519,7 @@ class Scans(BaseEntity):
         try:
             scan = self._data[index]
             scan.activate()
-            logger.info(f"Activated scan at index {index} with start={scan.get_start()}")
+            logger.info("Activated scan at index %s with start=%s", index, scan.get_start())
         except IndexError:
             logger.error(f"Invalid scan index: {index}")
             raise IndexError("Invalid scan index!")
@@ -531,7 +529,7 @@ class Scans(BaseEntity):
         try:
             scan = self._data[index]
             scan.deactivate()
-            logger.info(f"Deactivated scan at index {index} with start={scan.get_start()}")
+            logger.info("Deactivated scan at index %s with start=%s", index, scan.get_start())
         except IndexError:
             logger.error(f"Invalid scan index: {index}")
             raise IndexError("Invalid scan index!")
@@ -560,7 +558,7 @@ class Scans(BaseEntity):
         self._data = [s for s in self._data if not s.isactive]
         removed = initial_len - len(self._data)
         if removed > 0:
-            logger.info(f"Removed {removed} active scans from Scans")
+            logger.info("Removed %s active scans from Scans", removed)
         else:
             logger.debug("No active scans to drop")
         
@@ -570,41 +568,41 @@ class Scans(BaseEntity):
         self._data = [s for s in self._data if s.isactive]
         removed = initial_len - len(self._data)
         if removed > 0:
-            logger.info(f"Removed {removed} inactive scans from Scans")
+            logger.info("Removed %s inactive scans from Scans", removed)
         else:
             logger.debug("No inactive scans to drop")
 
     def clear(self) -> None:
         """Clear scans data"""
-        logger.info(f"Cleared {len(self._data)} scans from Scans")
+        logger.info("Cleared %s scans from Scans", len(self._data))
         self._data.clear()
 
     def to_dict(self) -> dict:
         """Convert Scans object to a dictionary for serialization"""
-        logger.info(f"Converted Scans with {len(self._data)} scans to dictionary")
+        logger.info("Converted Scans with %s scans to dictionary", len(self._data))
         return {"data": [scan.to_dict() for scan in self._data]}
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Scans':
         """Create a Scans object from a dictionary"""
         scans = [Scan.from_dict(scan_data) for scan_data in data["data"]]
-        logger.info(f"Created Scans with {len(scans)} scans from dictionary")
+        logger.info("Created Scans with %s scans from dictionary", len(scans))
         return cls(scans=scans)
     
     def _check_overlap(self, scan: 'Scan', exclude_index: int = -1, observation: 'Observation' = None) -> tuple[bool, str]:
         """Check if the scan overlaps with existing scans by time"""
-        from base.observation import Observation
-        for i, existing in enumerate(self._data):
-            if i == exclude_index or not existing.isactive or not scan.isactive:
-                continue
-            time_overlap = (existing.get_start() < scan.get_start() + scan.get_duration() and
-                            scan.get_start() < existing.get_start() + existing.get_duration())
-            if time_overlap:
-                reason = (f"overlaps with scan at index {i} (start={existing.get_start()}, "
-                        f"duration={existing.get_duration()})")
-                logger.debug(f"Overlap detected: {reason}")
-                return True, reason
-        logger.debug(f"No overlap detected for scan with start={scan.get_start()}")
+        if scan.isactive:
+            # the new scan's bounds are loop-invariant; the loop still stops at the first overlap
+            new_start = scan._start
+            new_end = new_start + scan._duration
+            for i, existing in enumerate(self._data):
+                if (existing._start < new_end and new_start < existing._start + existing._duration
+                        and existing.isactive and i != exclude_index):
+                    reason = (f"overlaps with scan at index {i} (start={existing.get_start()}, "
+                            f"duration={existing.get_duration()})")
+                    logger.debug("Overlap detected: %s", reason)
+                    return True, reason
+        logger.debug("No overlap detected for scan with start=%s", scan.get_start())
         return False, ""
 
     def __len__(self) -> int:
@@ -613,5 +611,5 @@ class Scans(BaseEntity):
 
     def __repr__(self) -> str:
         """Return a string representation of Scans."""
-        active_count = len(self.get_active_scans())
+        active_count = len([scan for scan in self._data if scan.isactive])
         return f"Scans(count={len(self._data)}, active={active_count}, inactive={len(self._data) - active_count})"
\ No newline at end of file
@@ -1,5 +1,5 @@
 from base.base_entity import BaseEntity
-from utils.validation import check_type, check_non_empty_string, check_positive, check_range
+from utils.validation import check_type, check_non_empty_string, check_positive, check_range, check_list_type
 from utils.logging_setup import logger
 import numpy as np
 from scipy.interpolate import CubicSpline
@@ -1094,9 +1094,7 @@ class Telescopes(BaseEntity):
         """Initialize Telescopes with a list of Telescope or SpaceTelescope objects."""
         super().__init__()
         if telescopes is not None:
-            check_type(telescopes, (list, tuple), "Telescopes")
-            for t in telescopes:
-                check_type(t, (Telescope, SpaceTelescope), "Telescope")
+            check_list_type(telescopes, (Telescope, SpaceTelescope), "Telescopes")
         self._data = telescopes if telescopes is not None else []
         logger.info(f"Initialized Telescopes with {len(self._data)} telescopes")
 
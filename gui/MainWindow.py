@@ -257,7 +257,7 @@ class PvCoreWindow(QMainWindow):
                 if new_pol:
                     freq_obj.set_polarization(new_pol)
                 else:
-                    freq_obj._polarization = None
+                    freq_obj.set_polarization(None)
             logger.info(f"Updated frequency at row {row} in observation '{selected}'")
             self.update_config_tables(obs)
             self.update_obs_table()
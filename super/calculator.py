@@ -1,5 +1,4 @@
 # super/calculator.py
-from abc import ABC
 from base.frequencies import Frequencies
 from base.sources import Sources, Source
 from base.telescopes import Telescope, SpaceTelescope, Telescopes, MountType
@@ -10,7 +9,7 @@ from utils.logging_setup import logger
 from typing import Dict, Any, Optional, Tuple, List
 import numpy as np
 from astropy.time import Time
-from astropy.coordinates import ITRS, GCRS, CartesianRepresentation, SkyCoord, AltAz, get_sun, HADec
+from astropy.coordinates import ITRS, GCRS, CIRS, CartesianRepresentation, SkyCoord, AltAz, get_sun, HADec
 import astropy.units as u
 from concurrent.futures import ThreadPoolExecutor
 from scipy.special import j1
@@ -18,7 +17,7 @@ import threading
 import math
 
 
-class Calculator(ABC):
+class Calculator:
     """Super-class for performing calculations on Project or Observation objects"""
     def __init__(self, manipulator: 'Manipulator'):
         """Initialize the Calculator"""
@@ -905,8 +904,6 @@ class Calculator(ABC):
 
     def _compute_mollweide_coords(self, coord: SkyCoord, time: Time) -> Tuple[float, float]:
         """Compute Mollweide projection coordinates with precession and nutation"""
-        from astropy.coordinates import CIRS
-        
         cirs_coord = coord.transform_to(CIRS(obstime=time))
         
         # Получаем RA и Dec в радианах
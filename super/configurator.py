@@ -1,5 +1,4 @@
 # /super/configurator.py
-from abc import ABC
 from base.frequencies import IF, Frequencies
 from base.sources import Source, Sources
 from base.telescopes import Telescope, SpaceTelescope, Telescopes
@@ -7,10 +6,16 @@ from base.scans import Scan, Scans
 from base.observation import Observation
 from base.project import Project 
 from utils.logging_setup import logger
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, FrozenSet
+from functools import lru_cache
 import inspect
 
-class Configurator(ABC):
+@lru_cache(maxsize=None)
+def _method_params(method: Callable) -> FrozenSet[str]:
+    """Parameter names of a registered method without 'self', computed once per method"""
+    return frozenset(inspect.signature(method).parameters) - {"self"}
+
+class Configurator:
     """Super-class for configuring Project and its components.
 
     Attributes:
@@ -47,12 +52,10 @@ class Configurator(ABC):
             return False
 
         method = valid_methods[method_name]
-        sig = inspect.signature(method)
-        expected_params = set(sig.parameters.keys()) - {"self"}
-        provided_params = set(method_args.keys())
+        expected_params = _method_params(method)
 
-        if not provided_params.issubset(expected_params):
-            logger.error(f"Invalid arguments for {method_name}: expected {expected_params}, got {provided_params}")
+        if not expected_params.issuperset(method_args):
+            logger.error(f"Invalid arguments for {method_name}: expected {set(expected_params)}, got {set(method_args)}")
             return False
 
         try:
@@ -74,7 +77,7 @@ class Configurator(ABC):
         if not applied:
             logger.warning("No valid methods provided for IF configuration")
             return False
-        logger.info(f"Successfully configured IF: freq={if_obj.get_frequency()}, bw={if_obj.get_bandwidth()}")
+        logger.info("Successfully configured IF: freq=%s, bw=%s", if_obj.get_frequency(), if_obj.get_bandwidth())
         return True
 
     def _configure_frequencies(self, freq_obj: Frequencies, attributes: Dict[str, Any]) -> bool:
@@ -95,7 +98,7 @@ class Configurator(ABC):
         if not applied:
             logger.warning("No valid methods provided for Frequencies configuration")
             return False
-        logger.info(f"Successfully configured Frequencies: count={len(freq_obj)}")
+        logger.info("Successfully configured Frequencies: count=%s", len(freq_obj))
         return True
 
     def _configure_source(self, source_obj: Source, attributes: Dict[str, Any]) -> bool:
@@ -108,7 +111,7 @@ class Configurator(ABC):
         if not applied:
             logger.warning("No valid methods provided for Source configuration")
             return False
-        logger.info(f"Successfully configured Source: name='{source_obj.get_name()}'")
+        logger.info("Successfully configured Source: name='%s'", source_obj.get_name())
         return True
 
     def _configure_sources(self, sources_obj: Sources, attributes: Dict[str, Any]) -> bool:
@@ -129,7 +132,7 @@ class Configurator(ABC):
         if not applied:
             logger.warning("No valid methods provided for Sources configuration")
             return False
-        logger.info(f"Successfully configured Sources: count={len(sources_obj)}")
+        logger.info("Successfully configured Sources: count=%s", len(sources_obj))
         return True
 
     def _configure_telescope(self, tel_obj: Telescope | SpaceTelescope, attributes: Dict[str, Any]) -> bool:
@@ -141,9 +144,9 @@ class Configurator(ABC):
             if self._validate_and_apply_method(tel_obj, method_name, method_args, valid_methods):
                 applied = True
         if not applied:
-            logger.warning(f"No valid methods provided for {obj_type.__name__} configuration")
+            logger.warning("No valid methods provided for %s configuration", obj_type.__name__)
             return False
-        logger.info(f"Successfully configured {obj_type.__name__}: code='{tel_obj.get_code()}'")
+        logger.info("Successfully configured %s: code='%s'", obj_type.__name__, tel_obj.get_code())
         return True
 
     def _configure_telescopes(self, tel_obj: Telescopes, attributes: Dict[str, Any]) -> bool:
@@ -164,7 +167,7 @@ class Configurator(ABC):
         if not applied:
             logger.warning("No valid methods provided for Telescopes configuration")
             return False
-        logger.info(f"Successfully configured Telescopes: count={len(tel_obj)}")
+        logger.info("Successfully configured Telescopes: count=%s", len(tel_obj))
         return True
 
     def _configure_scan(self, scan_obj: Scan, attributes: Dict[str, Any]) -> bool:
@@ -175,7 +178,7 @@ class Configurator(ABC):
         for method_name, method_args in attributes.items():
             if method_name == "observation":
                 continue
-            extra_args = {"observation": observation} if observation and "observation" in inspect.signature(valid_methods[method_name]).parameters else {}
+            extra_args = {"observation": observation} if observation and "observation" in _method_params(valid_methods[method_name]) else {}
             if self._validate_and_apply_method(scan_obj, method_name, method_args, valid_methods, extra_args):
                 applied = True
                 if observation and not scan_obj.validate_with_observation(observation):
@@ -185,7 +188,7 @@ class Configurator(ABC):
             logger.warning("No valid methods provided for Scan configuration")
             return False
         source_str = "OFF SOURCE" if scan_obj.is_off_source else f"source_index={scan_obj.get_source_index()}"
-        logger.info(f"Successfully configured Scan: start={scan_obj.get_start()}, {source_str}")
+        logger.info("Successfully configured Scan: start=%s, %s", scan_obj.get_start(), source_str)
         return True
 
     def _configure_scans(self, scans_obj: Scans, attributes: Dict[str, Any]) -> bool:
@@ -212,7 +215,7 @@ class Configurator(ABC):
         if not applied:
             logger.warning("No valid methods provided for Scans configuration")
             return False
-        logger.info(f"Successfully configured Scans: count={len(scans_obj)}")
+        logger.info("Successfully configured Scans: count=%s", len(scans_obj))
         return True
 
     def _configure_observation(self, obs_obj: Observation, attributes: Dict[str, Any]) -> bool:
@@ -228,7 +231,7 @@ class Configurator(ABC):
         if not obs_obj.validate():
             logger.error(f"Observation '{obs_obj.get_observation_code()}' is invalid after configuration")
             return False
-        logger.info(f"Successfully configured Observation: code='{obs_obj.get_observation_code()}'")
+        logger.info("Successfully configured Observation: code='%s'", obs_obj.get_observation_code())
         return True
 
     def _configure_project(self, project_obj: Project, attributes: Dict[str, Any]) -> bool:
@@ -237,10 +240,11 @@ class Configurator(ABC):
         applied = False
         if "observation_index" in attributes:
             obs_index = attributes["observation_index"]
-            if not isinstance(obs_index, int) or not 0 <= obs_index < len(project_obj.get_observations()):
-                logger.error(f"Invalid observation_index {obs_index} for Project '{project_obj.get_name()}' with {len(project_obj.get_observations())} observations")
+            observations = project_obj.get_observations()
+            if not isinstance(obs_index, int) or not 0 <= obs_index < len(observations):
+                logger.error(f"Invalid observation_index {obs_index} for Project '{project_obj.get_name()}' with {len(observations)} observations")
                 return False
-            obs_obj = project_obj.get_by_index(obs_index)
+            obs_obj = observations[obs_index]
             nested_attrs = {k: v for k, v in attributes.items() if k != "observation_index"}
             return self._configure_observation(obs_obj, nested_attrs)
         for method_name, method_args in attributes.items():
@@ -249,7 +253,7 @@ class Configurator(ABC):
         if not applied:
             logger.warning("No valid methods provided for Project configuration")
             return False
-        logger.info(f"Successfully configured Project: name='{project_obj.get_name()}', observations_count={len(project_obj.get_observations())}")
+        logger.info("Successfully configured Project: name='%s', observations_count=%s", project_obj.get_name(), len(project_obj.get_observations()))
         return True
 
     def execute(self, obj: Any, attributes: Dict[str, Any]) -> bool:
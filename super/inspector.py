@@ -1,17 +1,15 @@
 # /super/inspector.py
-from abc import ABC
 from base.frequencies import IF, Frequencies
 from base.sources import Source, Sources
 from base.telescopes import Telescope, SpaceTelescope, Telescopes
 from base.scans import Scan, Scans
 from base.observation import Observation
 from base.project import Project
+from super.configurator import _method_params
 from utils.logging_setup import logger
 from typing import Dict, Any, Callable, Union, Optional
-from functools import lru_cache
-import inspect
 
-class Inspector(ABC):
+class Inspector:
     """Super-class for inspecting data from Project and its components
 
     Attributes:
@@ -46,13 +44,11 @@ class Inspector(ABC):
             return None
 
         getter = valid_getters[getter_name]
-        sig = inspect.signature(getter)
-        expected_params = set(sig.parameters.keys()) - {"self"}
 
         if getter_args:
-            provided_params = set(getter_args.keys())
-            if not provided_params.issubset(expected_params):
-                logger.error(f"Invalid arguments for {getter_name}: expected {expected_params}, got {provided_params}")
+            expected_params = _method_params(getter)
+            if not expected_params.issuperset(getter_args):
+                logger.error(f"Invalid arguments for {getter_name}: expected {set(expected_params)}, got {set(getter_args)}")
                 return None
 
         try:
@@ -262,10 +258,11 @@ class Inspector(ABC):
         result = {}
         if "observation_index" in attributes:
             observation_index = attributes["observation_index"]
-            if not isinstance(observation_index, int) or not 0 <= observation_index < len(project_obj.get_observations()):
-                logger.error(f"Invalid observation_index {observation_index} for Project with {len(project_obj.get_observations())} observations")
+            observations = project_obj.get_observations()
+            if not isinstance(observation_index, int) or not 0 <= observation_index < len(observations):
+                logger.error(f"Invalid observation_index {observation_index} for Project with {len(observations)} observations")
                 return {}
-            observation_obj = project_obj.get_by_index(observation_index)
+            observation_obj = observations[observation_index]
             nested_attrs = {k: v for k, v in attributes.items() if k != "observation_index"}
             return self._inspect_observation(observation_obj, nested_attrs)
         for getter_name, getter_args in attributes.items():
@@ -1,5 +1,4 @@
 # super/manipulator.py
-from abc import ABC
 from typing import Dict, Any, Optional, Union, Callable
 from base.project import Project
 from base.observation import Observation
@@ -11,10 +10,16 @@ from super.configurator import Configurator, DefaultConfigurator
 from super.inspector import Inspector, DefaultInspector
 from super.calculator import Calculator, DefaultCalculator
 from utils.logging_setup import logger
-from functools import lru_cache
 import inspect
 
-class Manipulator(ABC):
+# request operation -> (super-class, Manipulator attribute holding its instance)
+_OPERATIONS = {
+    "configure": (Configurator, "_configurator"),
+    "inspect": (Inspector, "_inspector"),
+    "calculate": (Calculator, "_calculator")
+}
+
+class Manipulator:
     """Super-class for managing Project and orchestrating interactions with other super-classes."""
     def __init__(self, project: Optional[Project] = None,
              configurator: Optional[Configurator] = None,
@@ -32,7 +37,7 @@ class Manipulator(ABC):
             logger.error(f"Expected Project instance, got {type(project)}")
             raise ValueError(f"Expected Project instance, got {type(project)}")
         self._project = project
-        logger.info(f"Set project '{project.get_name()}' in Manipulator")
+        logger.info("Set project '%s' in Manipulator", project.get_name())
 
     def get_project(self) -> Optional[Project]:
         return self._project
@@ -46,15 +51,10 @@ class Manipulator(ABC):
             raise ValueError(f"Unsupported object type: {type(obj)}")
 
     def _get_super_class_instance(self, operation: str) -> Union[Configurator, Inspector, Calculator]:
-        operation_map = {
-            "configure": self._configurator,
-            "inspect": self._inspector,
-            "calculate": self._calculator
-        }
-        if operation not in operation_map:
+        if operation not in _OPERATIONS:
             logger.error(f"Unsupported operation: {operation}")
             raise ValueError(f"Unsupported operation: {operation}")
-        return operation_map[operation]
+        return getattr(self, _OPERATIONS[operation][1])
     
     def get_methods_for_type(self, obj_type: type) -> Dict[str, Callable]:
         """Get a specific section of the method registry (e.g., 'configure', 'inspect', 'calculate')"""
@@ -63,19 +63,10 @@ class Manipulator(ABC):
             raise ValueError(f"No methods registered for type {obj_type.__name__}")
         return self._registry[obj_type]
 
-    @lru_cache(maxsize=1)
     def _get_method_registry(self) -> Dict[type, Dict[str, Callable]]:
-        from base.frequencies import IF, Frequencies
-        from base.sources import Source, Sources
-        from base.telescopes import Telescope, SpaceTelescope, Telescopes
-        from base.scans import Scan, Scans
-        from base.observation import Observation
-        from base.project import Project
-
         base_classes = [
             Project, Observation, IF, Frequencies, Source, Sources,
-            Telescope, SpaceTelescope, Telescopes, Scan, Scans,
-            Configurator, Inspector, Calculator
+            Telescope, SpaceTelescope, Telescopes, Scan, Scans
         ]
 
         registry = {}
@@ -90,20 +81,18 @@ class Manipulator(ABC):
                 if not name.startswith('__')
             }
             registry[super_class] = methods
-            logger.debug(f"Registered {len(methods)} methods for {super_class.__name__}")
+            logger.debug("Registered %s methods for %s", len(methods), super_class.__name__)
 
         for cls in base_classes:
-            if cls in {Configurator, Inspector, Calculator}:
-                continue
             methods = {
                 name: getattr(cls, name) for name, _ in inspect.getmembers(cls)
                 if inspect.isfunction(getattr(cls, name, None)) or inspect.ismethod(getattr(cls, name, None))
                 and not name.startswith('_')
             }
             registry[cls] = methods
-            logger.debug(f"Registered {len(methods)} methods for {cls.__name__}")
+            logger.debug("Registered %s methods for %s", len(methods), cls.__name__)
 
-        logger.info(f"Method registry initialized with {len(registry)} types")
+        logger.info("Method registry initialized with %s types", len(registry))
         return registry
 
     def process_request(self, operation: str, target: str, attributes: Dict[str, Any],
@@ -115,22 +104,10 @@ class Manipulator(ABC):
         target_obj = obj if obj is not None else self._project
         self._validate_object(target_obj, target)
 
-        operation_map = {
-            "configure": Configurator,
-            "inspect": Inspector,
-            "calculate": Calculator
-        }
-
-        if operation not in operation_map:
+        if operation not in _OPERATIONS:
             logger.error(f"Unsupported operation: {operation}")
             raise ValueError(f"Unsupported operation: {operation}")
-
-        super_type = operation_map[operation]
-        super_instance = {
-            Configurator: self._configurator,
-            Inspector: self._inspector,
-            Calculator: self._calculator
-        }[super_type]
+        super_type, instance_attr = _OPERATIONS[operation]
 
         obj_type = type(target_obj)
         if obj_type not in self._registry:
@@ -141,7 +118,7 @@ class Manipulator(ABC):
             logger.error(f"No execute method found for {super_type.__name__}")
             raise ValueError(f"No execute method for {operation}")
 
-        return super_instance.execute(target_obj, attributes)
+        return getattr(self, instance_attr).execute(target_obj, attributes)
 
     def __repr__(self) -> str:
         project_name = self._project.get_name() if self._project else "None"
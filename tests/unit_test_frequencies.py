@@ -26,6 +26,10 @@ class TestFrequencies(unittest.TestCase):
         self.assertTrue(self.if1.isactive)
         self.assertEqual(self.if2.get_polarization(), ["LL"])
         self.assertFalse(self.if2.isactive)
+        self.assertFalse(hasattr(self.if1, "__dict__"))
+        self.if2.set_if(1500.0, 8.0, polarization="RR")
+        self.assertEqual(self.if2.get_polarization(), ["RR"])
+        self.assertTrue(self.if2.isactive)
 
     def test_if_polarization_validation(self) -> None:
         """Test polarization validation."""
@@ -42,6 +46,9 @@ class TestFrequencies(unittest.TestCase):
         self.assertAlmostEqual(wavelength, C_MHZ_CM / 1000.0, places=4)
         self.if1.set_frequency_wavelength(29.9792458)  # ~1000 MHz
         self.assertAlmostEqual(self.if1.get_frequency(), 1000.0, places=4)
+        self.assertEqual(self.if1.get_frequency_wavelength(), 29.9792458)
+        self.if1.set_frequency(2000.0)
+        self.assertAlmostEqual(self.if1.get_frequency_wavelength(), C_MHZ_CM / 2000.0)
         with self.assertRaises(ValueError):
             IF(freq=0.0)  # Zero frequency
 
@@ -55,6 +62,39 @@ class TestFrequencies(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.frequencies.add_IF(IF(freq=1010.0, bandwidth=30.0))  # Overlap with 1000-1032
 
+    def test_frequencies_getters(self) -> None:
+        """Test bulk frequency and bandwidth getters."""
+        self.assertEqual(self.frequencies.get_frequencies().tolist(), [1000.0, 2000.0])
+        self.assertEqual(self.frequencies.get_bandwidths().tolist(), [32.0, 16.0])
+        self.assertEqual(self.frequencies.get_polarizations(), [["RCP"], ["LL"]])
+        self.assertEqual(Frequencies().get_frequencies().size, 0)
+        for wavelength, freq in zip(self.frequencies.get_wavelengths(), [1000.0, 2000.0]):
+            self.assertAlmostEqual(wavelength, C_MHZ_CM / freq)
+        self.if2._frequency = 0.0  # bypass setter validation
+        with self.assertRaises(ValueError):
+            self.frequencies.get_wavelengths()
+        with self.assertRaises(ValueError):
+            self.frequencies.get_wavelength_spans()
+
+    def test_frequencies_wavelength_spans(self) -> None:
+        """Test wavelength span calculation."""
+        spans = self.frequencies.get_wavelength_spans()
+        self.assertAlmostEqual(spans[0], C_MHZ_CM / 1000.0 - C_MHZ_CM / 1032.0)
+        self.assertAlmostEqual(spans[1], C_MHZ_CM / 2000.0 - C_MHZ_CM / 2016.0)
+        self.assertEqual(Frequencies().get_wavelength_spans().size, 0)
+
+    def test_frequencies_active_wavelengths_in_band(self) -> None:
+        """Test wavelengths of active IFs within a frequency band."""
+        self.frequencies.create_IF(freq=1500.0, bandwidth=16.0)
+        self.frequencies.create_IF(freq=5000.0, bandwidth=16.0)
+        wavelengths = self.frequencies.get_active_wavelengths_in_band(1000.0, 2000.0)
+        self.assertEqual(len(wavelengths), 2)  # 2000 MHz IF is inactive, 5000 MHz is out of band
+        self.assertAlmostEqual(wavelengths[0], C_MHZ_CM / 1000.0)
+        self.assertAlmostEqual(wavelengths[1], C_MHZ_CM / 1500.0)
+        self.assertEqual(self.frequencies.get_active_wavelengths_in_band(6000.0, 7000.0).size, 0)
+        with self.assertRaises(ValueError):
+            self.frequencies.get_active_wavelengths_in_band(2000.0, 1000.0)
+
     def test_frequencies_activation(self) -> None:
         """Test IF activation/deactivation."""
         self.frequencies.deactivate_IF(0)
@@ -64,11 +104,46 @@ class TestFrequencies(unittest.TestCase):
         self.assertTrue(self.frequencies.get_by_index(0).isactive)
         self.frequencies.activate_all()
         self.assertEqual(len(self.frequencies.get_active_frequencies()), 2)
+        self.assertEqual(repr(self.frequencies), "Frequencies(count=2, active=2, inactive=0)")
+        self.frequencies.deactivate_all()
+        self.assertFalse(self.if1.isactive or self.if2.isactive)
+        with self.assertRaises(ValueError):
+            Frequencies().activate_all()
+
+    def test_frequencies_drop(self) -> None:
+        """Test dropping active and inactive IFs."""
+        self.assertEqual(self.frequencies.get_inactive_frequencies(), [self.if2])
+        self.frequencies.drop_inactive()
+        self.assertEqual(self.frequencies.get_all_IF(), [self.if1])
+        with self.assertRaises(ValueError):
+            self.frequencies.drop_inactive()
+        self.frequencies.drop_active()
+        self.assertEqual(len(self.frequencies), 0)
+
+    def test_frequencies_remove_batch(self) -> None:
+        """Test removing several IFs at once."""
+        self.frequencies.create_IFs([3000.0, 4000.0], [16.0, 16.0])
+        self.frequencies.remove_IFs([0, 2])
+        self.assertEqual(self.frequencies.get_frequencies().tolist(), [2000.0, 4000.0])
+        with self.assertRaises(IndexError):
+            self.frequencies.remove_IFs([5])
+        with self.assertRaises(TypeError):
+            self.frequencies.remove_IFs([True, False])
+        with self.assertRaises(TypeError):
+            self.frequencies.remove_IFs([1.9])
+        with self.assertRaises(TypeError):
+            self.frequencies.remove_IFs(1)
+        self.assertEqual(len(self.frequencies), 2)
+        self.frequencies.remove_IFs([-1])
+        self.assertEqual(self.frequencies.get_frequencies().tolist(), [2000.0])
 
     def test_frequencies_serialization(self) -> None:
         """Test Frequencies to/from dict serialization."""
         freq_dict = self.frequencies.to_dict()
         self.assertEqual(len(freq_dict["data"]), 2)
+        self.assertEqual(freq_dict["data"][1], self.if2.to_dict())
+        int_dict = Frequencies([IF(freq=1000, bandwidth=16)]).to_dict()
+        self.assertIsInstance(int_dict["data"][0]["frequency"], int)
         restored_freqs = Frequencies.from_dict(freq_dict)
         self.assertEqual(restored_freqs.get_by_index(0).get_frequency(), 1000.0)
         self.assertEqual(restored_freqs.get_by_index(1).get_polarization(), ["LL"])
@@ -82,5 +157,18 @@ class TestFrequencies(unittest.TestCase):
         self.frequencies.add_IF(IF(freq=1060.0, bandwidth=10.0))  # No overlap
         self.assertEqual(len(self.frequencies), 2)
 
+    def test_frequencies_create_batch(self) -> None:
+        """Test bulk IF creation."""
+        self.frequencies.create_IFs([3000.0, 4000.0], [16.0, 16.0], polarization="RCP")
+        self.assertEqual(len(self.frequencies), 4)
+        self.assertEqual(self.frequencies.get_by_index(3).get_polarization(), ["RCP"])
+        with self.assertRaises(ValueError):
+            self.frequencies.create_IFs([5000.0, 5010.0], [16.0, 16.0])  # Overlap within batch
+        with self.assertRaises(ValueError):
+            self.frequencies.create_IFs([5000.0, 1990.0], [16.0, 16.0])  # Overlap with 2000-2016
+        with self.assertRaises(ValueError):
+            self.frequencies.create_IFs([5000.0], [-1.0])  # Non-positive bandwidth
+        self.assertEqual(len(self.frequencies), 4)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,5 +1,8 @@
 import unittest
+import json
 from datetime import datetime
+import numpy as np
+import astropy.units as u
 from base.sources import Source, Sources
 from base.telescopes import Telescope, Telescopes
 from base.frequencies import Frequencies, IF  # Предполагается, что класс IF определён в frequencies.py
@@ -34,6 +37,7 @@ class TestObservation(unittest.TestCase):
         self.assertEqual(self.observation.get_frequencies(), self.frequencies)
         self.assertEqual(self.observation.get_scans(), self.scans)
         self.assertTrue(self.observation.isactive)
+        self.assertFalse(hasattr(self.observation, "__dict__"))
 
     def test_get_methods(self):
         self.assertEqual(self.observation.get_observation_code(), "OBS001")
@@ -49,6 +53,15 @@ class TestObservation(unittest.TestCase):
                                         frequencies=self.frequencies, scans=self.scans)
         self.assertEqual(self.observation.get_observation_code(), "OBS002")
         self.assertEqual(self.observation.get_sources().get_all_sources()[0].get_name(), "NEW_SRC")
+        self.assertIs(new_sources._parent, self.observation)
+        new_telescopes = Telescopes()
+        self.observation.set_telescopes(new_telescopes)
+        self.assertIs(new_telescopes._parent, self.observation)
+        self.observation.set_calculated_data_by_key("uv", [1.0])
+        self.observation.set_telescopes(new_telescopes)  # same container keeps calculated data
+        self.assertEqual(self.observation.get_calculated_data(), {"uv": [1.0]})
+        self.observation.set_scans(Scans())
+        self.assertEqual(self.observation.get_calculated_data(), {})
 
     def test_serialization(self):
         obs_dict = self.observation.to_dict()
@@ -59,6 +72,13 @@ class TestObservation(unittest.TestCase):
         self.assertEqual(len(obs_dict["scans"]["data"]), 1)
         self.assertTrue(obs_dict["isactive"])
 
+    def test_to_json(self):
+        self.observation.set_calculated_data_by_key("uv", {"u": np.arange(3) * u.m, "flux": 1.5 * u.Jy,
+                                                           "mask": np.array([True, False])})
+        restored = json.loads(self.observation.to_json())
+        self.assertEqual(restored, json.loads(json.dumps(self.observation.to_dict())))
+        self.assertEqual(restored["calculated_data"]["uv"]["u"], [0.0, 1.0, 2.0])
+
     def test_deserialization(self):
         obs_dict = self.observation.to_dict()
         new_obs = Observation.from_dict(obs_dict)
@@ -68,6 +88,23 @@ class TestObservation(unittest.TestCase):
         self.assertEqual(new_obs.get_frequencies().get_all_IF()[0].get_frequency(), 1400.0)
         self.assertEqual(new_obs.get_scans().get_all_scans()[0].get_start(), 1625097600.0)
 
+    def test_insert_entities(self):
+        new_telescopes = [Telescope(code="T2", name="Second", x=1.0, y=2.0, z=3.0, diameter=10.0),
+                          Telescope(code="T3", name="Third", x=1.0, y=2.0, z=3.0, diameter=10.0)]
+        self.observation.insert_telescopes(0, new_telescopes)
+        self.assertEqual(self.scan.get_telescope_indices(), [2])
+        self.assertEqual(self.observation.get_telescopes().get_all_telescopes()[2].get_code(), "T1")
+
+        self.observation.insert_frequencies(1, [IF(freq=2000.0, bandwidth=16.0)])
+        self.assertEqual(self.scan.get_frequency_indices(), [0])
+        with self.assertRaises(ValueError):
+            self.observation.insert_frequencies(0, [IF(freq=3000.0, bandwidth=16.0), IF(freq=1400.0, bandwidth=8.0)])
+        self.assertEqual(len(self.observation.get_frequencies()), 2)  # partial insert rolled back
+        self.assertEqual(self.scan.get_frequency_indices(), [0])
+
+        self.observation.insert_sources(0, [Source(name="SRC0", ra_h=1, ra_m=0, ra_s=0.0, de_d=10, de_m=0, de_s=0.0)])
+        self.assertEqual(self.scan.get_source_index(), 1)
+
     def test_scan_validation(self):
         # Проверка валидации сканирования с корректными индексами
         self.assertTrue(self.scan.validate_with_observation(self.observation))
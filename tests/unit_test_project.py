@@ -6,6 +6,7 @@ from base.telescopes import Telescope, Telescopes
 from base.frequencies import Frequencies, IF
 from base.scans import Scan, Scans
 from base.observation import Observation
+from base.project import Project
 
 class TestObservation(unittest.TestCase):
     def setUp(self):
@@ -130,6 +131,11 @@ class TestObservation(unittest.TestCase):
         self.assertIsNone(self.scan.get_source_index())
         self.assertTrue(self.scan.is_off_source)
 
+        self.observation._update_scan_indices("telescopes", inserted_index=0)
+        self.assertEqual(self.scan.get_telescope_indices(), [1])
+        self.observation._update_scan_indices("telescopes", removed_index=1)
+        self.assertEqual(self.scan.get_telescope_indices(), [])
+
     def test_sync_scans_with_activation(self):
         self.telescopes.deactivate_telescope(0)
         self.observation._sync_scans_with_activation("telescopes", 0, False)
@@ -139,6 +145,11 @@ class TestObservation(unittest.TestCase):
         self.observation._sync_scans_with_activation("telescopes", 0, True)
         self.assertEqual(self.scan.get_telescope_indices(), [0])
 
+        self.frequencies.deactivate_IF(0)  # notifies the parent observation
+        self.assertEqual(self.scan.get_frequency_indices(), [])
+        self.frequencies.activate_IF(0)
+        self.assertEqual(self.scan.get_frequency_indices(), [0])
+
     def test_activation_deactivation(self):
         self.observation.deactivate()
         self.assertFalse(self.observation.isactive)
@@ -150,6 +161,25 @@ class TestObservation(unittest.TestCase):
         self.observation.activate()
         self.assertTrue(self.observation.isactive)
 
+    def test_project_add_observations(self):
+        project = Project(name="PRJ", observations=[self.observation])
+        second = Observation(observation_code="OBS002")
+        project.add_observations([second])
+        self.assertEqual(project.get_observations(), [self.observation, second])
+        with self.assertRaises(TypeError):
+            project.add_observations([second, "OBS003"])
+        self.assertEqual(len(project.get_observations()), 2)
+
+    def test_project_get_by_code(self):
+        second = Observation(observation_code="OBS002")
+        project = Project(name="PRJ", observations=[self.observation, second])
+        self.assertIs(project.get_by_code("OBS002"), second)
+        project.remove_observation(0)
+        self.assertIsNone(project.get_by_code("OBS001"))
+        second.set_observation_code("OBS003")
+        self.assertIs(project.get_by_code("OBS003"), second)
+        self.assertIsNone(project.get_by_code("OBS002"))
+
     def test_repr(self):
         repr_str = repr(self.observation)
         self.assertIn("OBS001", repr_str)
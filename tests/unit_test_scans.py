@@ -91,6 +91,16 @@ class TestScans(unittest.TestCase):
             overlap_scan = Scan(start=1000.0, duration=400.0, telescope_indices=[0])
             self.scans.add_scan(overlap_scan, self.observation)  # Пересечение по времени и телескопам
 
+    def test_scans_overlap(self) -> None:
+        """Test time overlap detection against existing scans."""
+        overlap, reason = self.scans._check_overlap(Scan(start=1250.0, duration=100.0))
+        self.assertTrue(overlap)
+        self.assertIn("index 0", reason)
+        self.assertFalse(self.scans._check_overlap(Scan(start=1300.0, duration=200.0))[0])  # touches both, no overlap
+        self.assertFalse(self.scans._check_overlap(Scan(start=1250.0, duration=100.0), exclude_index=0)[0])
+        self.scans.deactivate_scan(0)
+        self.assertFalse(self.scans._check_overlap(Scan(start=1250.0, duration=100.0))[0])
+
     def test_scans_activation(self) -> None:
         """Test scan activation/deactivation."""
         self.scans.deactivate_scan(0)
@@ -6,8 +6,13 @@ from utils.logging_setup import logger
 from typing import Optional, List
 import re
 
+# precompiled coordinate patterns for catalog parsing
+_RA_RE = re.compile(r'(\d{2}):(\d{2}):(\d{2}\.\d+)')
+_DEC_RE = re.compile(r'([-+])?(\d{2}):(\d{2}):(\d{2}\.\d+)')
+
 class CatalogManager:
     """Class to control catalogs"""
+    __slots__ = ("source_catalog", "telescope_catalog", "_source_by_name", "_telescope_by_code")
     
     def __init__(self, source_file: Optional[str] = None, telescope_file: Optional[str] = None):
         """Initialize catalog manager
@@ -24,6 +29,8 @@ class CatalogManager:
             raise TypeError("telescope_file must be a string or None!")
         self.source_catalog = Sources()
         self.telescope_catalog = Telescopes()
+        self._source_by_name = {}  # lazy B1950/J2000 name -> catalog position index for get_source
+        self._telescope_by_code = {}  # lazy telescope code -> catalog position index for get_telescope
         
         if source_file:
             self.load_source_catalog(source_file)
@@ -52,7 +59,7 @@ class CatalogManager:
                     line = line.strip()
                     if not line or line.startswith('#'):
                         continue
-                    parts = re.split(r'\s+', line)
+                    parts = line.split()
                     if len(parts) < 5:
                         logger.warning(f"Skipping invalid source format: {line}")
                         failed_count += 1
@@ -64,12 +71,12 @@ class CatalogManager:
                     ra_str, dec_str = parts[-2], parts[-1]
 
                     try:
-                        ra_match = re.match(r'(\d{2}):(\d{2}):(\d{2}\.\d+)', ra_str)
+                        ra_match = _RA_RE.match(ra_str)
                         if not ra_match:
                             raise ValueError(f"Invalid RA format: {ra_str}")
                         ra_h, ra_m, ra_s = map(float, ra_match.groups())
 
-                        dec_match = re.match(r'([-+])?(\d{2}):(\d{2}):(\d{2}\.\d+)', dec_str)
+                        dec_match = _DEC_RE.match(dec_str)
                         if not dec_match:
                             raise ValueError(f"Invalid DEC format: {dec_str}")
                         sign, de_d, de_m, de_s = dec_match.groups()
@@ -89,6 +96,7 @@ class CatalogManager:
                         failed_count += 1
                         continue
             self.source_catalog = Sources(sources)
+            self._source_by_name.clear()
             if failed_count > 0:
                 logger.warning(f"Loaded {len(sources)} sources from '{source_file}', {failed_count} failed")
             else:
@@ -100,8 +108,21 @@ class CatalogManager:
 
     def get_source(self, name: str) -> Optional[Source]:
         """Get source from catalog by name (B1950 или J2000)"""
-        return next((s for s in self.source_catalog.get_all_sources() 
-                     if s.name == name or (s.name_J2000 and s.name_J2000 == name)), None)
+        sources = self.source_catalog.get_all_sources()
+        index = self._source_by_name.get(name)
+        if index is None or index >= len(sources) or \
+                name not in (sources[index].get_name(), sources[index].get_name_J2000()):
+            # the catalog can be edited in place, so a miss or stale hit rebuilds the index
+            self._source_by_name.clear()
+            for i, s in enumerate(sources):
+                # setdefault keeps the first catalog entry matching a name, as a linear scan would
+                self._source_by_name.setdefault(s.get_name(), i)
+                if s.get_name_J2000():
+                    self._source_by_name.setdefault(s.get_name_J2000(), i)
+            index = self._source_by_name.get(name)
+            if index is None:
+                return None
+        return sources[index]
 
     def get_sources_by_ra_range(self, ra_min: float, ra_max: float) -> List[Source]:
         """Get list of sources in the range of (RA) (degrees)"""
@@ -133,7 +154,7 @@ class CatalogManager:
                     line = line.strip()
                     if not line or line.startswith('#'):
                         continue
-                    parts = re.split(r'\s+', line)
+                    parts = line.split()
                     if len(parts) < 6:
                         logger.warning(f"Skipping invalid telescope format: {line}")
                         failed_count += 1
@@ -159,6 +180,7 @@ class CatalogManager:
                         failed_count += 1
                         continue
             self.telescope_catalog = Telescopes(telescopes)
+            self._telescope_by_code.clear()
             if failed_count > 0:
                 logger.warning(f"Loaded {len(telescopes)} telescopes from '{telescope_file}', {failed_count} failed")
             else:
@@ -170,7 +192,17 @@ class CatalogManager:
 
     def get_telescope(self, code: str) -> Optional[Telescope]:
         """Get telescope by code"""
-        return next((t for t in self.telescope_catalog.get_all_telescopes() if t.code == code), None)
+        telescopes = self.telescope_catalog.get_all_telescopes()
+        index = self._telescope_by_code.get(code)
+        if index is None or index >= len(telescopes) or telescopes[index].get_code() != code:
+            # the catalog can be edited in place, so a miss or stale hit rebuilds the index
+            self._telescope_by_code.clear()
+            for i, t in enumerate(telescopes):
+                self._telescope_by_code.setdefault(t.get_code(), i)
+            index = self._telescope_by_code.get(code)
+            if index is None:
+                return None
+        return telescopes[index]
 
     def get_telescopes_by_type(self, telescope_type: str = "Telescope") -> List[Telescope]:
         """Get telescopes by type"""
@@ -181,6 +213,8 @@ class CatalogManager:
         """Clear both catalogs"""
         self.source_catalog.clear()
         self.telescope_catalog.clear()
+        self._source_by_name.clear()
+        self._telescope_by_code.clear()
 
     def __repr__(self) -> str:
         """String representation of CatalogManager"""
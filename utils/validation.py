@@ -1,4 +1,5 @@
 # utils/validation.py
+from itertools import repeat
 from utils.logging_setup import logger
 
 def check_type(value, expected_type, name: str) -> None:
@@ -38,10 +39,12 @@ def check_list_type(lst: list, expected_type, name: str) -> None:
     if not isinstance(lst, (list, tuple)):
         logger.error(f"{name} must be a list or tuple, got {type(lst)}")
         raise TypeError(f"{name} must be a list or tuple, got {type(lst)}")
-    for item in lst:
-        if not isinstance(item, expected_type):
-            logger.error(f"All items in {name} must be of type {expected_type}, got {type(item)}")
-            raise TypeError(f"All items in {name} must be of type {expected_type}, got {type(item)}")
+    # C-level pass for the common all-valid case; locate the offender only on failure
+    if all(map(isinstance, lst, repeat(expected_type))):
+        return
+    item = next(item for item in lst if not isinstance(item, expected_type))
+    logger.error(f"All items in {name} must be of type {expected_type}, got {type(item)}")
+    raise TypeError(f"All items in {name} must be of type {expected_type}, got {type(item)}")
 
 def check_non_negative(value: float, name: str) -> None:
     """Check if value is non-negative."""